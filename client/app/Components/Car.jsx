@@ -117,7 +117,8 @@ const Car = () => {
           ) : (
             // Render ACTUAL data from Admin
             cars.map((car) => {
-              const fullImageUrl = getImageUrl(car.image_url || car.image);
+              // Card-sized WebP variant once the server has generated it
+              const fullImageUrl = getImageUrl(car.image_variants?.card?.webp || car.image_url || car.image);
               
               return (
                 <SwiperSlide key={car.id} className="py-4">
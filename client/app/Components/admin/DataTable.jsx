@@ -6,7 +6,10 @@ export default function DataTable({
   loading = false, 
   emptyMessage = 'No data available',
   actions = null,
-  onRowClick = null
+  onRowClick = null,
+  hasMore = false,
+  loadingMore = false,
+  onLoadMore = null
 }) {
   if (loading) {
     return (
@@ -63,6 +66,17 @@ export default function DataTable({
           ))}
         </tbody>
       </table>
+      {hasMore && onLoadMore && (
+        <div className="flex justify-center py-4">
+          <button
+            onClick={onLoadMore}
+            disabled={loadingMore}
+            className="px-4 py-2 bg-gray-100 dark:bg-gray-700 text-gray-700 dark:text-gray-300 rounded-lg hover:bg-gray-200 dark:hover:bg-gray-600 transition-colors disabled:opacity-50"
+          >
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
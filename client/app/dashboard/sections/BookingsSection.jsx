@@ -3,24 +3,40 @@ import { useEffect, useState } from 'react';
 import DataTable from '@/app/Components/admin/DataTable';
 import { bookingAPI } from '@/app/lib/api';
 
+const PAGE_SIZE = 50;
+
 export default function BookingsSection() {
   const [bookings, setBookings] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextPage, setNextPage] = useState(null); // cursor, or offset while searching
+  const [truncated, setTruncated] = useState(false); // search ranked only the newest matches
   const [error, setError] = useState('');
   const [statusFilter, setStatusFilter] = useState('');
+  const [search, setSearch] = useState('');
+  const [query, setQuery] = useState('');
   const [updatingBookingId, setUpdatingBookingId] = useState(null);
 
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [search]);
+
   useEffect(() => {
     loadBookings();
-  }, [statusFilter]);
+  }, [statusFilter, query]);
+
+  const fetchBookings = (page = null) =>
+    query ? bookingAPI.search(getFilters(page)) : bookingAPI.getAll(getFilters(page));
 
   const loadBookings = async () => {
     try {
       setLoading(true);
       setError('');
-      const filters = statusFilter ? { status: statusFilter } : {};
-      const data = await bookingAPI.getAll(filters);
+      const data = await fetchBookings();
       setBookings(data.bookings || []);
+      setNextPage(data.next_cursor ?? data.next_offset ?? null);
+      setTruncated(Boolean(data.truncated));
     } catch (err) {
       setError(err.message || 'Failed to load bookings');
     } finally {
@@ -28,6 +44,32 @@ export default function BookingsSection() {
     }
   };
 
+  const loadMoreBookings = async () => {
+    if (nextPage === null) return;
+    try {
+      setLoadingMore(true);
+      const data = await fetchBookings(nextPage);
+      setBookings((prev) => [...prev, ...(data.bookings || [])]);
+      setNextPage(data.next_cursor ?? data.next_offset ?? null);
+    } catch (err) {
+      setError(err.message || 'Failed to load bookings');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const getFilters = (page = null) => {
+    const filters = { limit: PAGE_SIZE };
+    if (statusFilter) filters.status = statusFilter;
+    if (query) {
+      filters.q = query;
+      if (page !== null) filters.offset = page;
+    } else if (page !== null) {
+      filters.cursor = page;
+    }
+    return filters;
+  };
+
   const handleStatusChange = async (bookingId, newStatus) => {
     try {
       setUpdatingBookingId(bookingId);
@@ -136,6 +178,13 @@ export default function BookingsSection() {
           </p>
         </div>
         <div className="flex gap-2">
+          <input
+            type="search"
+            value={search}
+            onChange={(e) => setSearch(e.target.value)}
+            placeholder="Search location or email"
+            className="px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-800 dark:text-white focus:outline-none focus:ring-2 focus:ring-blue-500"
+          />
           <select
             value={statusFilter}
             onChange={(e) => setStatusFilter(e.target.value)}
@@ -156,6 +205,12 @@ export default function BookingsSection() {
         </div>
       </div>
 
+      {truncated && (
+        <div className="bg-yellow-50 dark:bg-yellow-900/20 border border-yellow-200 dark:border-yellow-800 text-yellow-800 dark:text-yellow-300 p-4 rounded-lg">
+          Too many matches: only the most recent bookings were searched. Add words to narrow the search.
+        </div>
+      )}
+
       {error && (
         <div className="bg-red-50 dark:bg-red-900/20 border border-red-200 dark:border-red-800 text-red-700 dark:text-red-400 p-4 rounded-lg">
           {error}
@@ -168,6 +223,9 @@ export default function BookingsSection() {
         loading={loading}
         emptyMessage="No bookings found"
         actions={actions}
+        hasMore={nextPage !== null}
+        loadingMore={loadingMore}
+        onLoadMore={loadMoreBookings}
       />
     </div>
   );
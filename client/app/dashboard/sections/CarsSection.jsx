@@ -6,6 +6,7 @@ import { carAPI } from '@/app/lib/api';
 // CONFIGURATION: Replace this with your actual backend URL
 // If you are using Flask locally, it is usually http://localhost:4000
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:4000';
+const PAGE_SIZE = 50;
 
 export default function CarsSection() {
   const [cars, setCars] = useState([]);
@@ -17,6 +18,10 @@ export default function CarsSection() {
   const [showCreateModal, setShowCreateModal] = useState(false);
   const [saving, setSaving] = useState(false);
   const [deletingCarId, setDeletingCarId] = useState(null);
+  const [search, setSearch] = useState('');
+  const [query, setQuery] = useState('');
+  const [nextOffset, setNextOffset] = useState(null); // only while searching
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const [formData, setFormData] = useState({
     name: '',
@@ -29,9 +34,14 @@ export default function CarsSection() {
     preview: '',      // PREVIEW URL / BASE64
   });
 
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(search.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [search]);
+
   useEffect(() => {
     loadCars();
-  }, []);
+  }, [query]);
 
   // --- HELPER: Resolve Image URL ---
   const getImageUrl = (path) => {
@@ -53,11 +63,17 @@ export default function CarsSection() {
     return `${API_BASE_URL}${cleanPath}`;
   };
 
+  const fetchCars = (offset = null) =>
+    query
+      ? carAPI.search({ q: query, limit: PAGE_SIZE, ...(offset !== null && { offset }) })
+      : carAPI.getAll(false);
+
   const loadCars = async () => {
     try {
       setLoading(true);
-      const data = await carAPI.getAll(false);
+      const data = await fetchCars();
       setCars(data.cars || []);
+      setNextOffset(data.next_offset ?? null);
       setOffline(false);
     } catch (err) {
       setError('Backend unavailable');
@@ -69,6 +85,20 @@ export default function CarsSection() {
     }
   };
 
+  const loadMoreCars = async () => {
+    if (nextOffset === null) return;
+    try {
+      setLoadingMore(true);
+      const data = await fetchCars(nextOffset);
+      setCars((prev) => [...prev, ...(data.cars || [])]);
+      setNextOffset(data.next_offset ?? null);
+    } catch (err) {
+      setError(err.message || 'Failed to load cars');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleCreate = () => {
     setEditingCar(null);
     setFormData({
@@ -212,7 +242,7 @@ export default function CarsSection() {
       header: 'Image',
       render: (car) => (
         <img
-          src={getImageUrl(car.image_url)}
+          src={getImageUrl(car.image_variants?.thumbnail?.webp || car.image_url)}
           className="w-20 h-20 object-cover rounded-lg border border-gray-200"
           alt={car.name}
           // Fallback if image fails to load
@@ -371,19 +401,33 @@ export default function CarsSection() {
           <h2 className="text-2xl font-bold">Cars Management</h2>
           {offline && <span className="text-xs text-red-500 font-semibold">⚠ Offline Mode</span>}
         </div>
-        <button 
-          onClick={handleCreate} 
-          className="bg-blue-600 text-white px-4 py-2 rounded hover:bg-blue-700 transition"
-        >
-          + Add Car
-        </button>
+        <div className="flex gap-2">
+          <input
+            type="search"
+            value={search}
+            onChange={(e) => setSearch(e.target.value)}
+            placeholder="Search name, brand or details"
+            disabled={offline}
+            className="px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-800 dark:text-white focus:outline-none focus:ring-2 focus:ring-blue-500 disabled:opacity-50"
+          />
+          <button 
+            onClick={handleCreate} 
+            className="bg-blue-600 text-white px-4 py-2 rounded hover:bg-blue-700 transition"
+          >
+            + Add Car
+          </button>
+        </div>
       </div>
 
       <DataTable
         columns={columns}
         data={cars}
         loading={loading}
+        emptyMessage={query ? 'No cars match your search' : undefined}
         actions={actions}
+        hasMore={nextOffset !== null}
+        loadingMore={loadingMore}
+        onLoadMore={loadMoreCars}
       />
       {renderModal(true)}
       {renderModal(false)}
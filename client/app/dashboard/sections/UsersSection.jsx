@@ -3,9 +3,13 @@ import { useEffect, useState } from 'react';
 import DataTable from '@/app/Components/admin/DataTable';
 import { userAPI } from '@/app/lib/api';
 
+const PAGE_SIZE = 50;
+
 export default function UsersSection() {
   const [users, setUsers] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
   const [error, setError] = useState('');
   const [updatingUserId, setUpdatingUserId] = useState(null);
 
@@ -17,8 +21,9 @@ export default function UsersSection() {
     try {
       setLoading(true);
       setError('');
-      const data = await userAPI.getAll();
+      const data = await userAPI.getAll({ limit: PAGE_SIZE });
       setUsers(data.users || []);
+      setNextCursor(data.next_cursor || null);
     } catch (err) {
       setError(err.message || 'Failed to load users');
     } finally {
@@ -26,6 +31,20 @@ export default function UsersSection() {
     }
   };
 
+  const loadMoreUsers = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const data = await userAPI.getAll({ limit: PAGE_SIZE, cursor: nextCursor });
+      setUsers((prev) => [...prev, ...(data.users || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err) {
+      setError(err.message || 'Failed to load users');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleRoleChange = async (userId, newRole, originalRole) => {
     // Get current user to check if we're changing their own role
     const currentUser = users.find(u => u.id === userId);
@@ -190,6 +209,9 @@ export default function UsersSection() {
         loading={loading}
         emptyMessage="No users found"
         actions={actions}
+        hasMore={!!nextCursor}
+        loadingMore={loadingMore}
+        onLoadMore={loadMoreUsers}
       />
     </div>
   );
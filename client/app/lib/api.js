@@ -98,7 +98,10 @@ async function formDataRequest(endpoint, options = {}) {
 
 // Users
 export const userAPI = {
-  getAll: () => apiRequest('/api/users'),
+  getAll: (params = {}) => {
+    const query = new URLSearchParams(params).toString();
+    return apiRequest(`/api/users${query ? `?${query}` : ''}`);
+  },
   updateRole: (userId, role) =>
     apiRequest(`/api/users/${userId}/role`, {
       method: 'PATCH',
@@ -112,6 +115,8 @@ export const bookingAPI = {
     const params = new URLSearchParams(filters).toString();
     return apiRequest(`/api/bookings${params ? `?${params}` : ''}`);
   },
+  search: (filters) =>
+    apiRequest(`/api/bookings/search?${new URLSearchParams(filters).toString()}`),
   updateStatus: (bookingId, status) =>
     apiRequest(`/api/bookings/${bookingId}/status`, {
       method: 'PATCH',
@@ -169,6 +174,9 @@ export const carAPI = {
   getAll: (activeOnly = true) =>
     apiRequest(`/api/cars${activeOnly ? '?active=true' : ''}`),
 
+  search: (filters) =>
+    apiRequest(`/api/cars/search?${new URLSearchParams(filters).toString()}`),
+
   create: (formData) =>
     formDataRequest('/api/cars', {
       method: 'POST',
@@ -135,6 +135,10 @@ export default function ProfileSettingsPage() {
       const data = await response.json();
 
       if (data.success) {
+        // Older tokens are revoked on password change
+        if (data.token) {
+          localStorage.setItem('token', data.token);
+        }
         setMessage({ type: 'success', text: 'Password changed successfully!' });
         setCurrentPassword('');
         setNewPassword('');
@@ -0,0 +1,62 @@
+"""
+Car transport API.
+
+create_app() builds a configured Flask app without touching the database;
+the schema is created and upgraded by `flask db-upgrade` (or init_db()).
+"""
+import os
+
+from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+# rollup and storage register mapper events for daily_stats and stored_files
+from . import cache, emails, images, passwords, ratelimit, rollup, routing, search, security, storage
+from .blueprints import auth, bookings, cars, content, core, dashboard, users
+from .commands import register_commands
+from .config import Config
+from .database import build_engine_options
+from .extensions import cors, db, mail
+from .json_provider import FastJSONProvider
+from .migrations import init_db
+from .storage import UPLOAD_ROOT
+
+__all__ = ['create_app', 'init_db']
+
+
+def create_app(config=None):
+    """Build the app. `config` overrides any Config setting (e.g. the database URI in tests)."""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config.from_object(Config)
+    if config:
+        app.config.update(config)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', build_engine_options(app.config))
+    app.config.setdefault('UPLOAD_ROOT', os.path.abspath(UPLOAD_ROOT))
+    routing.configure_replica_binds(app)
+    proxies = app.config['TRUSTED_PROXIES']
+    if proxies:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies, x_proto=proxies, x_host=proxies)
+
+    db.init_app(app)
+    mail.init_app(app)
+    cors.init_app(app,
+                  origins=app.config['CORS_ORIGINS'],
+                  supports_credentials=True,
+                  allow_headers=["Content-Type", "Authorization"],
+                  methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+                  expose_headers=["Content-Type", "Authorization"])
+
+    cache.init_app(app)
+    security.init_app(app)
+    passwords.init_app(app)
+    ratelimit.init_app(app)
+    routing.init_app(app)
+    emails.init_app(app)
+    images.init_app(app)
+    search.init_app(app)
+
+    for module in (core, auth, users, bookings, cars, content, dashboard):
+        app.register_blueprint(module.bp)
+    register_commands(app)
+
+    return app
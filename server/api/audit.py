@@ -0,0 +1,202 @@
+"""
+Query plan audit (`flask audit-queries`).
+
+Calls each read endpoint through the test client, records the SQL it runs,
+then EXPLAINs every statement against the current database and reports the
+sequential scans. Run it against a seeded database (`flask seed-data`):
+on near-empty tables the planner rightly prefers sequential scans.
+
+profile_requests() backs the per-endpoint benchmarks (benchmarks.py) in the
+same way, counting statements and timing each request.
+"""
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import sqlalchemy as sa
+from flask import current_app
+
+from .extensions import db
+from .models import Booking, Car, User
+from .search import search_terms
+from .security import generate_token
+
+
+def audit_requests():
+    """
+    [(path, tables a full scan is expected on)]. The unfiltered catalog and
+    content reads return every row, and the dashboard sums the whole daily_stats rollup.
+    """
+    week_ago = (datetime.utcnow() - timedelta(days=7)).date().isoformat()
+    # Off Postgres, search loads its in-memory index with one full read
+    search_scans = set() if db.engine.dialect.name == 'postgresql' else {'bookings', 'cars'}
+    booking = Booking.query.order_by(Booking.id.desc()).first()
+    car = Car.query.order_by(Car.id.desc()).first()
+    booking_q = search_terms(booking.pickup_location)[0] if booking else 'airport'
+    car_q = search_terms(car.name)[0] if car else 'toyota'
+    return [
+        ('/api/cars', {'cars'}),
+        ('/api/cars?active=true&limit=50', set()),
+        ('/api/cars?limit=50', set()),
+        (f'/api/cars/search?q={car_q}', search_scans),
+        ('/api/bookings?limit=50', set()),
+        ('/api/bookings?status=pending&limit=50', set()),
+        ('/api/bookings/my-bookings', set()),
+        (f'/api/bookings/search?q={booking_q}', search_scans),
+        (f'/api/bookings/export?from={week_ago}', set()),
+        ('/api/users?limit=50', set()),
+        (f'/api/users/export?from={week_ago}', set()),
+        ('/api/dashboard', {'daily_stats'}),
+        ('/api/dashboard/summary', {'daily_stats'}),
+        ('/api/dashboard/charts?range=90d', {'daily_stats'}),
+        ('/api/public/content', {'content_blocks'}),
+        ('/api/content', {'content_blocks'}),
+    ]
+
+
+def admin_token():
+    """A token for the first verified admin. Raises RuntimeError if there is none."""
+    admin = User.query.filter_by(status='admin', is_verified=True).first()
+    if admin is None:
+        raise RuntimeError('No verified admin user; run `flask seed-data` first')
+    return generate_token(admin)
+
+def run_isolated(fn):
+    """
+    Run `fn` in its own thread, so every test-client request gets a fresh app
+    context (and `g`) instead of sharing the CLI's. Returns its result.
+    """
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(fn).result()
+
+def _unique_url(path):
+    # A unique parameter keeps cached responses from skipping the query
+    separator = '&' if '?' in path else '?'
+    return f'{path}{separator}_audit={uuid.uuid4().hex}'
+
+
+def capture_queries(app, requests, token):
+    """
+    Run `requests` against `app` and return [(path, statement, parameters)].
+    Paginated responses are followed to their second page.
+    """
+    captured = []
+    path = None
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            captured.append((path, statement, parameters))
+
+    def run():
+        nonlocal path
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {token}'}
+        for request_path, _ in requests:
+            path = request_path
+            url = _unique_url(request_path)
+            response = client.get(url, headers=headers)
+            body = response.get_json(silent=True) or {}
+            if body.get('next_cursor'):
+                client.get(f"{url}&cursor={body['next_cursor']}", headers=headers)
+            elif body.get('next_offset'):
+                client.get(f"{url}&offset={body['next_offset']}", headers=headers)
+
+    sa.event.listen(sa.engine.Engine, 'before_cursor_execute', record)
+    try:
+        run_isolated(run)
+    finally:
+        sa.event.remove(sa.engine.Engine, 'before_cursor_execute', record)
+    return captured
+
+
+def profile_requests(app, paths, token, repeat=1):
+    """
+    GET each of `paths` `repeat` times against `app`, bypassing cached
+    responses. Returns {path: {'status', 'statements', 'rows', 'ms'}}: the
+    last run's status, SQL statement count and number of items in its first
+    list field, and the median latency in milliseconds.
+    """
+    statements = 0
+
+    def count(connection, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    def run():
+        nonlocal statements
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {token}'}
+        results = {}
+        for path in paths:
+            timings = []
+            for _ in range(repeat):
+                statements = 0
+                started = time.perf_counter()
+                response = client.get(_unique_url(path), headers=headers)
+                timings.append((time.perf_counter() - started) * 1000)
+            body = response.get_json(silent=True) or {}
+            lists = [value for value in body.values() if isinstance(value, list)]
+            results[path] = {'status': response.status_code, 'statements': statements,
+                             'rows': len(lists[0]) if lists else None, 'ms': statistics.median(timings)}
+        return results
+
+    sa.event.listen(sa.engine.Engine, 'before_cursor_execute', count)
+    try:
+        return run_isolated(run)
+    finally:
+        sa.event.remove(sa.engine.Engine, 'before_cursor_execute', count)
+
+
+def _postgres_seq_scans(plan):
+    if plan.get('Node Type') == 'Seq Scan':
+        yield plan['Relation Name']
+    for child in plan.get('Plans', []):
+        yield from _postgres_seq_scans(child)
+
+def sequential_scans(connection, statement, parameters):
+    """Tables `statement` reads with a sequential scan, per the planner"""
+    if connection.dialect.name == 'postgresql':
+        plan = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters).scalar()
+        return set(_postgres_seq_scans(plan[0]['Plan']))
+    if connection.dialect.name == 'sqlite':
+        scans = set()
+        for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters):
+            words = row[-1].split()
+            # "SCAN bookings" is a full scan; "SCAN bookings USING INDEX ..." walks an index
+            if words[0] == 'SCAN' and 'INDEX' not in words and words[1] in db.metadata.tables:
+                scans.add(words[1])
+        return scans
+    return set()
+
+
+def audit_queries(min_rows=10000):
+    """
+    EXPLAIN every query the read endpoints run. Returns a list of
+    {'path', 'statement', 'table', 'rows', 'expected'} per sequential scan,
+    skipping tables with fewer than `min_rows` rows.
+    """
+    token = admin_token()
+    requests = audit_requests()
+    expected = dict(requests)
+    captured = capture_queries(current_app._get_current_object(), requests, token)
+
+    findings = []
+    seen = set()
+    row_counts = {}
+    with db.engine.connect() as connection:
+        for path, statement, parameters in captured:
+            if (path, statement) in seen or not statement.lstrip().upper().startswith('SELECT'):
+                continue
+            seen.add((path, statement))
+            for table in sorted(sequential_scans(connection, statement, parameters)):
+                if table not in row_counts:
+                    row_counts[table] = connection.execute(
+                        sa.select(sa.func.count()).select_from(sa.table(table))).scalar()
+                if row_counts[table] < min_rows:
+                    continue
+                findings.append({'path': path, 'statement': ' '.join(statement.split()), 'table': table,
+                                 'rows': row_counts[table], 'expected': table in expected[path]})
+    return findings
+
@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta
+
+from flask import Blueprint, jsonify, request
+
+from ..emails import send_verification_email
+from ..extensions import db
+from ..models import User
+from ..passwords import PasswordHasherBusy, get_password_hasher
+from ..ratelimit import rate_limited
+from ..security import generate_token, generate_verification_code, invalidate_auth_state
+
+bp = Blueprint('auth', __name__)
+
+
+@bp.route('/api/auth/register', methods=['POST'])
+def register():
+    """Register a new user and send verification code"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'success': False, 'message': 'No data provided'}), 400
+        
+        name = data.get('name', '').strip()
+        email = data.get('email', '').strip().lower()
+        password = data.get('password', '')
+        
+        if not all([name, email, password]):
+            return jsonify({'success': False, 'message': 'Name, email, and password are required'}), 400
+        
+        if len(password) < 6:
+            return jsonify({'success': False, 'message': 'Password must be at least 6 characters'}), 400
+        
+        existing_user = User.query.filter_by(email=email).first()
+        if existing_user:
+            if existing_user.is_verified:
+                return jsonify({'success': False, 'message': 'Email already registered'}), 409
+            
+            verification_code = generate_verification_code()
+            existing_user.verification_code = verification_code
+            existing_user.code_expires_at = datetime.utcnow() + timedelta(minutes=10)
+            db.session.commit()
+            
+            send_verification_email(email, verification_code, name)
+            
+            return jsonify({
+                'success': True,
+                'message': 'Verification code sent to your email',
+                'email': email
+            }), 200
+        
+        verification_code = generate_verification_code()
+        hashed_password = get_password_hasher().hash(password)
+        
+        new_user = User(
+            name=name,
+            email=email,
+            password=hashed_password,
+            verification_code=verification_code,
+            code_expires_at=datetime.utcnow() + timedelta(minutes=10)
+        )
+        
+        db.session.add(new_user)
+        db.session.commit()
+        
+        email_sent = send_verification_email(email, verification_code, name)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Registration successful. Verification code sent to your email.',
+            'email': email,
+            'email_sent': email_sent
+        }), 201
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Server is busy, please try again shortly'}), 503
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Register Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Registration failed. Please try again.'}), 500
+
+@bp.route('/api/auth/verify-email', methods=['POST'])
+@rate_limited('verify_email')
+def verify_email():
+    """Verify email with code"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'success': False, 'message': 'No data provided'}), 400
+        
+        email = data.get('email', '').strip().lower()
+        code = data.get('code', '').strip()
+        
+        if not email or not code:
+            return jsonify({'success': False, 'message': 'Email and verification code are required'}), 400
+        
+        user = User.query.filter_by(email=email).first()
+        
+        if not user:
+            return jsonify({'success': False, 'message': 'User not found'}), 404
+        
+        if user.is_verified:
+            return jsonify({'success': False, 'message': 'Email already verified'}), 400
+        
+        if not user.code_expires_at or user.code_expires_at < datetime.utcnow():
+            return jsonify({'success': False, 'message': 'Verification code has expired'}), 400
+        
+        if user.verification_code != code:
+            return jsonify({'success': False, 'message': 'Invalid verification code'}), 400
+        
+        user.is_verified = True
+        user.verification_code = None
+        user.code_expires_at = None
+        user.last_login = datetime.utcnow()
+        db.session.commit()
+        invalidate_auth_state(user.id)
+        
+        token = generate_token(user)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Email verified successfully',
+            'token': token,
+            'user': user.to_dict()
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Verify Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Verification failed'}), 500
+
+@bp.route('/api/auth/resend-code', methods=['POST'])
+@rate_limited('resend_code')
+def resend_code():
+    """Resend verification code"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'success': False, 'message': 'No data provided'}), 400
+        
+        email = data.get('email', '').strip().lower()
+        
+        if not email:
+            return jsonify({'success': False, 'message': 'Email is required'}), 400
+        
+        user = User.query.filter_by(email=email).first()
+        
+        if not user:
+            return jsonify({'success': False, 'message': 'User not found'}), 404
+        
+        if user.is_verified:
+            return jsonify({'success': False, 'message': 'Email already verified'}), 400
+        
+        verification_code = generate_verification_code()
+        user.verification_code = verification_code
+        user.code_expires_at = datetime.utcnow() + timedelta(minutes=10)
+        db.session.commit()
+        
+        email_sent = send_verification_email(email, verification_code, user.name)
+        
+        if email_sent:
+            return jsonify({'success': True, 'message': 'Verification code sent successfully'}), 200
+        else:
+            return jsonify({'success': False, 'message': 'Failed to send email'}), 500
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Resend Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to resend code'}), 500
+
+@bp.route('/api/auth/login', methods=['POST'])
+@rate_limited('login')
+def login():
+    """Login user"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({'success': False, 'message': 'No data provided'}), 400
+        
+        email = data.get('email', '').strip().lower()
+        password = data.get('password', '')
+        
+        if not email or not password:
+            return jsonify({'success': False, 'message': 'Email and password are required'}), 400
+        
+        user = User.query.filter_by(email=email).first()
+        
+        password_hasher = get_password_hasher()
+        if not user or not password_hasher.verify(user.password, password):
+            return jsonify({'success': False, 'message': 'Invalid email or password'}), 401
+        
+        if not user.is_verified:
+            return jsonify({
+                'success': False,
+                'message': 'Please verify your email before logging in',
+                'email_verified': False
+            }), 403
+        
+        if password_hasher.needs_rehash(user.password):
+            user.password = password_hasher.hash(password)
+        user.last_login = datetime.utcnow()
+        db.session.commit()
+        
+        token = generate_token(user)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Login successful',
+            'token': token,
+            'user': user.to_dict()
+        }), 200
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Server is busy, please try again shortly'}), 503
+    except Exception as e:
+        print(f"❌ Login Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Login failed'}), 500
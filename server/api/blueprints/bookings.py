@@ -0,0 +1,217 @@
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import joinedload
+
+from ..export import get_export_args, stream_export
+from ..extensions import db
+from ..models import Booking, User
+from ..pagination import get_page_args, paginate_keyset
+from ..routing import read_replica
+from ..search import get_search_args, search_bookings
+from ..security import role_required, token_required
+
+bp = Blueprint('bookings', __name__)
+
+
+@bp.route('/api/bookings', methods=['GET', 'POST'])
+@token_required
+@read_replica()
+def bookings_handler(current_user):
+    if request.method == 'POST':
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({'success': False, 'message': 'No data provided'}), 400
+            pickup_location = data.get('pickup_location', '').strip()
+            dropoff_location = data.get('dropoff_location', '').strip()
+            car_type = data.get('car_type', '').strip()
+            ride_date = data.get('ride_date')
+            if not all([pickup_location, dropoff_location, car_type]):
+                return jsonify({
+                    'success': False,
+                    'message': 'Pickup location, dropoff location, and car type are required'
+                }), 400
+            ride_date_obj = None
+            if ride_date:
+                try:
+                    ride_date_obj = datetime.fromisoformat(ride_date.replace('Z', '+00:00'))
+                except ValueError:
+                    return jsonify({'success': False, 'message': 'Invalid date format'}), 400
+            new_booking = Booking(
+                user_id=current_user.id,
+                pickup_location=pickup_location,
+                dropoff_location=dropoff_location,
+                car_type=car_type,
+                ride_date=ride_date_obj,
+                status='pending'
+            )
+            db.session.add(new_booking)
+            db.session.commit()
+            return jsonify({
+                'success': True,
+                'message': 'Booking created successfully',
+                'booking': new_booking.to_dict()
+            }), 201
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Create Booking Error: {str(e)}")
+            return jsonify({'success': False, 'message': 'Failed to create booking'}), 500
+    # GET method for admin/moderator
+    if current_user.status not in ['admin', 'moderator']:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    try:
+        limit, cursor = get_page_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        status = request.args.get('status')
+        query = Booking.query.options(joinedload(Booking.user))
+        if status:
+            query = query.filter_by(status=status)
+        bookings, next_cursor = paginate_keyset(query, Booking, limit, cursor)
+        bookings_list = [booking.to_dict() for booking in bookings]
+        return jsonify({'success': True, 'bookings': bookings_list, 'next_cursor': next_cursor}), 200
+    except Exception as e:
+        print(f"❌ Get All Bookings Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to fetch bookings'}), 500
+
+
+@bp.route('/api/bookings/export', methods=['GET'])
+@role_required(['admin', 'moderator'])
+@read_replica()
+def export_bookings(current_user):
+    """Stream bookings as NDJSON or CSV, filtered by status and date range - Admin/Moderator only"""
+    try:
+        export_format, start, end = get_export_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        columns = [
+            Booking.id, Booking.user_id, User.name.label('user_name'), User.email.label('user_email'),
+            Booking.pickup_location, Booking.dropoff_location, Booking.car_type, Booking.status,
+            Booking.price, Booking.ride_date, Booking.created_at, Booking.updated_at
+        ]
+        query = db.session.query(*columns).join(User, Booking.user_id == User.id)
+        status = request.args.get('status')
+        if status:
+            query = query.filter(Booking.status == status)
+        if start:
+            query = query.filter(Booking.created_at >= start)
+        if end:
+            query = query.filter(Booking.created_at < end)
+
+        return stream_export(query.order_by(Booking.created_at, Booking.id), [column.key for column in columns],
+                             export_format, 'bookings')
+    except Exception as e:
+        print(f"❌ Export Bookings Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to export bookings'}), 500
+
+
+@bp.route('/api/bookings/search', methods=['GET'])
+@role_required(['admin', 'moderator'])
+@read_replica()
+def search_bookings_endpoint(current_user):
+    """
+    Ranked search over pickup/dropoff location, car type and user email - Admin/Moderator only.
+    ?q=<words>&status=&limit=&offset=
+    """
+    try:
+        terms, limit, offset = get_search_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        bookings, next_offset, truncated = search_bookings(terms, offset, limit, request.args.get('status'))
+        return jsonify({
+            'success': True,
+            'bookings': [booking.to_dict() for booking in bookings],
+            'next_offset': next_offset,
+            # Only the newest SEARCH_MAX_CANDIDATES matches are ranked; narrow the query to reach older ones
+            'truncated': truncated
+        }), 200
+    except Exception as e:
+        print(f"❌ Search Bookings Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to search bookings'}), 500
+
+
+@bp.route('/api/bookings/my-bookings', methods=['GET'])
+@token_required
+@read_replica()
+def get_my_bookings(current_user):
+    """Get current user's bookings - Authenticated users only"""
+    try:
+        bookings = Booking.query.options(joinedload(Booking.user)) \
+            .filter_by(user_id=current_user.id).order_by(Booking.created_at.desc()).all()
+        bookings_list = [booking.to_dict() for booking in bookings]
+        
+        return jsonify({
+            'success': True,
+            'bookings': bookings_list
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Get My Bookings Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to fetch bookings'}), 500
+
+
+@bp.route('/api/bookings/<int:booking_id>/status', methods=['PATCH'])
+@role_required(['admin', 'moderator'])
+def update_booking_status(current_user, booking_id):
+    """
+    Update booking status (and optionally its price)
+    Allowed statuses: pending, confirmed, completed, cancelled
+    """
+    try:
+        data = request.get_json()
+
+        if not data or 'status' not in data:
+            return jsonify({
+                'success': False,
+                'message': 'Status is required'
+            }), 400
+
+        new_status = data['status'].strip().lower()
+
+        ALLOWED_STATUSES = ['pending', 'confirmed', 'completed', 'cancelled']
+        if new_status not in ALLOWED_STATUSES:
+            return jsonify({
+                'success': False,
+                'message': f'Invalid status. Allowed: {", ".join(ALLOWED_STATUSES)}'
+            }), 400
+
+        price = None
+        if data.get('price') is not None:
+            try:
+                price = Decimal(str(data['price']))
+            except InvalidOperation:
+                return jsonify({'success': False, 'message': 'Invalid price'}), 400
+            if not price.is_finite() or price < 0:
+                return jsonify({'success': False, 'message': 'Invalid price'}), 400
+
+        booking = Booking.query.get(booking_id)
+        if not booking:
+            return jsonify({
+                'success': False,
+                'message': 'Booking not found'
+            }), 404
+
+        booking.status = new_status
+        if price is not None:
+            booking.price = price
+        booking.updated_at = datetime.utcnow()
+        db.session.commit()
+
+        return jsonify({
+            'success': True,
+            'message': f'Booking status updated to {new_status}',
+            'booking': booking.to_dict()
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Booking Status Error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Failed to update booking status'
+        }), 500
@@ -0,0 +1,249 @@
+import json
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+from sqlalchemy import func, or_, type_coerce
+from sqlalchemy.dialects import postgresql
+
+from ..cache import cached_response, invalidate_cache
+from ..extensions import db
+from ..images import get_image_pipeline
+from ..models import Car
+from ..pagination import get_page_args, paginate_keyset
+from ..routing import read_replica
+from ..search import get_search_args, search_cars
+from ..security import role_required
+from ..uploads import UploadRejected, receive_upload
+from ..utils import parse_json_field
+
+bp = Blueprint('cars', __name__)
+
+
+def spec_filter(key, value):
+    """Match cars whose specs[key] equals `value` (string or numeric)"""
+    candidates = [value]
+    try:
+        number = float(value)
+        candidates.append(int(number) if number.is_integer() else number)
+    except ValueError:
+        pass
+    if db.engine.dialect.name == 'postgresql':
+        # JSONB containment (@>) is served by the GIN index on specs
+        specs = type_coerce(Car.specs, postgresql.JSONB)
+        return or_(*[specs.contains({key: candidate}) for candidate in candidates])
+    return or_(*[Car.specs[key] == func.json(json.dumps(candidate)) for candidate in candidates])
+
+
+@bp.route('/api/cars', methods=['GET'])
+@cached_response('cars')
+@read_replica('cars')
+def get_cars():
+    """
+    Get cars (public endpoint, optionally filter by active status).
+    Filter on spec values with spec.<key>=<value>, e.g. ?spec.fuel=Petrol.
+    Returns the whole catalog unless `limit` or `cursor` is given.
+    """
+    try:
+        limit, cursor = get_page_args(default_limit=None)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        active_only = request.args.get('active', 'false').lower() == 'true'
+        
+        query = Car.query
+        if active_only:
+            query = query.filter_by(is_active=True)
+        for arg, value in request.args.items():
+            if arg.startswith('spec.'):
+                query = query.filter(spec_filter(arg[len('spec.'):], value))
+        
+        cars, next_cursor = paginate_keyset(query, Car, limit, cursor)
+        cars_list = [car.to_dict() for car in cars]
+        
+        return jsonify({
+            'success': True,
+            'cars': cars_list,
+            'next_cursor': next_cursor
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Get Cars Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to fetch cars'}), 500
+
+
+@bp.route('/api/cars/search', methods=['GET'])
+@read_replica('cars')
+def search_cars_endpoint():
+    """
+    Ranked search over car name, brand and details (public endpoint).
+    ?q=<words>&active=true&limit=&offset=; every word is matched as a prefix.
+    """
+    try:
+        terms, limit, offset = get_search_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        active_only = request.args.get('active', 'false').lower() == 'true'
+        cars, next_offset = search_cars(terms, offset, limit, active_only)
+        return jsonify({
+            'success': True,
+            'cars': [car.to_dict() for car in cars],
+            'next_offset': next_offset
+        }), 200
+    except Exception as e:
+        print(f"❌ Search Cars Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to search cars'}), 500
+
+
+@bp.route('/api/cars', methods=['POST'])
+@role_required(['admin', 'moderator'])
+def create_car(current_user):
+    """Create a new car - Admin/Moderator only"""
+    try:
+        try:
+            upload = receive_upload('image', 'cars')
+        except UploadRejected as e:
+            return jsonify({'success': False, 'message': str(e)}), e.status
+        form = upload.form
+        name = form.get('name', '').strip()
+        brand = form.get('brand', '').strip()
+        details = form.get('details', '').strip()
+        year = form.get('year', '').strip()
+        seats = form.get('seats', '').strip()
+        transmission = form.get('transmission', '').strip()
+        fuel = form.get('fuel', '').strip()
+        try:
+            features = parse_json_field(form.get('features'), list, 'features')
+            specs = parse_json_field(form.get('specs'), dict, 'specs')
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+
+        # FIX: Check for 'true' OR '1' (since React sends '1')
+        is_active_raw = form.get('is_active', 'true').lower()
+        is_active = is_active_raw in ['true', '1']
+
+        if not name:
+            return jsonify({'success': False, 'message': 'Car name is required'}), 400
+
+        # Stored under uploads/cars/ by content hash, so re-uploads are free
+        image_url = upload.url
+
+        car = Car(
+            name=name,
+            brand=brand,
+            details=details,
+            year=year,
+            seats=seats,
+            transmission=transmission,
+            fuel=fuel,
+            features=features,
+            specs=specs,
+            image_url=image_url,
+            is_active=is_active
+        )
+        
+        db.session.add(car)
+        db.session.commit()
+        invalidate_cache('cars')
+        if image_url:
+            get_image_pipeline().schedule(car)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Car created successfully',
+            'car': car.to_dict()
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Create Car Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to create car'}), 500
+
+
+@bp.route('/api/cars/<int:car_id>', methods=['PUT'])
+@role_required(['admin', 'moderator'])
+def update_car(current_user, car_id):
+    """Update a car - Admin/Moderator only"""
+    try:
+        car = Car.query.get(car_id)
+        if not car:
+            return jsonify({'success': False, 'message': 'Car not found'}), 404
+        
+        try:
+            upload = receive_upload('image', 'cars')
+        except UploadRejected as e:
+            return jsonify({'success': False, 'message': str(e)}), e.status
+        form = upload.form
+
+        if 'name' in form:
+            car.name = form.get('name', '').strip()
+        if 'brand' in form:
+            car.brand = form.get('brand', '').strip()
+        if 'details' in form:
+            car.details = form.get('details', '').strip()
+        if 'year' in form:
+            car.year = form.get('year', '').strip()
+        if 'seats' in form:
+            car.seats = form.get('seats', '').strip()
+        if 'transmission' in form:
+            car.transmission = form.get('transmission', '').strip()
+        if 'fuel' in form:
+            car.fuel = form.get('fuel', '').strip()
+        try:
+            if 'features' in form:
+                car.features = parse_json_field(form.get('features'), list, 'features')
+            if 'specs' in form:
+                car.specs = parse_json_field(form.get('specs'), dict, 'specs')
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+
+        # FIX: Properly handle the is_active toggle
+        if 'is_active' in form:
+            is_active_raw = form.get('is_active', '').lower()
+            car.is_active = is_active_raw in ['true', '1']
+
+        image_uploaded = upload.url is not None
+        if image_uploaded:
+            car.image_url = upload.url
+            car.image_variants = None
+        
+        car.updated_at = datetime.utcnow()
+        db.session.commit()
+        invalidate_cache('cars')
+        if image_uploaded:
+            get_image_pipeline().schedule(car)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Car updated successfully',
+            'car': car.to_dict()
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Car Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to update car'}), 500
+
+
+@bp.route('/api/cars/<int:car_id>', methods=['DELETE'])
+@role_required(['admin', 'moderator'])
+def delete_car(current_user, car_id):
+    """Delete a car - Admin/Moderator only"""
+    try:
+        car = Car.query.get(car_id)
+        if not car:
+            return jsonify({'success': False, 'message': 'Car not found'}), 404
+        
+        db.session.delete(car)
+        db.session.commit()
+        invalidate_cache('cars')
+        
+        return jsonify({
+            'success': True,
+            'message': 'Car deleted successfully'
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Delete Car Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to delete car'}), 500
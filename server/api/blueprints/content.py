@@ -0,0 +1,227 @@
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import joinedload
+
+from ..cache import cached_response, invalidate_cache
+from ..extensions import db
+from ..images import get_image_pipeline
+from ..models import ContentBlock
+from ..routing import read_replica
+from ..security import role_required
+from ..uploads import UploadRejected, receive_upload
+
+bp = Blueprint('content', __name__)
+
+
+@bp.route('/api/public/content', methods=['GET'])
+@cached_response('content')
+@read_replica('content_blocks')
+def get_public_content():
+    """Get content blocks for public website display"""
+    try:
+        key_filter = request.args.get('key')
+        
+        query = ContentBlock.query
+        if key_filter:
+            query = query.filter_by(key=key_filter)
+        
+        content_blocks = query.order_by(ContentBlock.key).all()
+        blocks_dict = {block.key: {
+            'title': block.title,
+            'content': block.content,
+            'media_url': block.media_url,
+            'media_variants': block.media_variants or {}
+        } for block in content_blocks}
+        
+        return jsonify({
+            'success': True,
+            'content': blocks_dict
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Get Public Content Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to fetch content'}), 500
+
+
+@bp.route('/api/content', methods=['GET'])
+@role_required(['admin', 'moderator'])
+def get_content_blocks(current_user):
+    try:
+        key_filter = request.args.get('key')
+        query = ContentBlock.query.options(joinedload(ContentBlock.updater))
+
+        if key_filter:
+            query = query.filter_by(key=key_filter)
+
+        blocks = query.order_by(ContentBlock.key).all()
+
+        return jsonify({
+            'success': True,
+            'content_blocks': [block.to_dict() for block in blocks]
+        }), 200
+
+    except Exception as e:
+        print(f"❌ Get Content Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'message': 'Failed to fetch content blocks'}), 500
+
+
+@bp.route('/api/content', methods=['POST'])
+@role_required(['admin'])
+def create_content_block(current_user):
+    try:
+        try:
+            upload = receive_upload('media_file', 'content')
+        except UploadRejected as e:
+            return jsonify({'success': False, 'message': str(e)}), e.status
+        form = upload.form
+        key = form.get('key', '').strip()
+        title = form.get('title', '').strip()
+        content = form.get('content', '').strip()
+
+        print(f"📝 Creating content block: key={key}, title={title}")
+
+        if not key:
+            return jsonify({'success': False, 'message': 'Key is required'}), 400
+
+        if ContentBlock.query.filter_by(key=key).first():
+            return jsonify({'success': False, 'message': 'Content block key already exists'}), 409
+
+        # Stored under uploads/content/ by content hash
+        media_url = upload.url
+        if media_url:
+            print(f"✅ File saved: {media_url}")
+
+        block = ContentBlock(
+            key=key,
+            title=title,
+            content=content,
+            media_url=media_url,
+            updated_by=current_user.id
+        )
+
+        db.session.add(block)
+        db.session.commit()
+        invalidate_cache('content')
+        if media_url:
+            get_image_pipeline().schedule(block)
+
+        print(f"✅ Content block created: ID={block.id}")
+
+        return jsonify({
+            'success': True,
+            'message': 'Content block created',
+            'content_block': block.to_dict()
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Create Content Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'message': f'Failed to create content block: {str(e)}'}), 500
+
+
+@bp.route('/api/content/<int:block_id>', methods=['PUT'])
+@role_required(['admin'])
+def update_content_block(current_user, block_id):
+    try:
+        print(f"🔄 Updating content block ID: {block_id}")
+        
+        block = ContentBlock.query.get(block_id)
+        if not block:
+            print(f"❌ Block not found: {block_id}")
+            return jsonify({'success': False, 'message': 'Content block not found'}), 404
+
+        print(f"📦 Current block: key={block.key}, title={block.title}")
+
+        try:
+            upload = receive_upload('media_file', 'content')
+        except UploadRejected as e:
+            return jsonify({'success': False, 'message': str(e)}), e.status
+        form = upload.form
+
+        # Get form data
+        title = form.get('title')
+        content = form.get('content')
+
+        print(f"📝 New data: title={title}, content={content[:50] if content else None}...")
+
+        if title is not None:
+            block.title = title.strip()
+        if content is not None:
+            block.content = content.strip()
+
+        # Handle file upload. The old file may be shared with other blocks;
+        # `flask gc-uploads` removes it once nothing references it
+        media_uploaded = upload.url is not None
+        if media_uploaded:
+            block.media_url = upload.url
+            block.media_variants = None
+            print(f"✅ New media URL: {block.media_url}")
+        else:
+            print("ℹ️ No file uploaded")
+
+        block.updated_by = current_user.id
+        block.updated_at = datetime.utcnow()
+        db.session.commit()
+        invalidate_cache('content')
+        if media_uploaded:
+            get_image_pipeline().schedule(block)
+
+        print(f"✅ Content block updated successfully")
+
+        return jsonify({
+            'success': True,
+            'message': 'Content block updated',
+            'content_block': block.to_dict()
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Content Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'message': f'Failed to update content block: {str(e)}'}), 500
+
+
+@bp.route('/api/content/<int:block_id>/json', methods=['PUT'])
+@role_required(['admin'])
+def update_content_block_json(current_user, block_id):
+    """Update content block with JSON data only (no file upload)"""
+    try:
+        print(f"🔄 JSON Update for block ID: {block_id}")
+        
+        block = ContentBlock.query.get(block_id)
+        if not block:
+            return jsonify({'success': False, 'message': 'Content block not found'}), 404
+
+        data = request.get_json()
+        print(f"📝 JSON data received: {data}")
+        
+        if 'title' in data:
+            block.title = data['title'].strip()
+        if 'content' in data:
+            block.content = data['content'].strip()
+
+        block.updated_by = current_user.id
+        block.updated_at = datetime.utcnow()
+        db.session.commit()
+        invalidate_cache('content')
+
+        print(f"✅ JSON update successful")
+
+        return jsonify({
+            'success': True,
+            'message': 'Content block updated',
+            'content_block': block.to_dict()
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Content JSON Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'message': f'Failed to update content block: {str(e)}'}), 500
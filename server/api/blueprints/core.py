@@ -0,0 +1,138 @@
+import mimetypes
+import os
+import re
+from datetime import datetime
+
+from flask import Blueprint, abort, current_app, jsonify, request, send_file
+from werkzeug.security import safe_join
+
+from ..database import pool_status
+from ..extensions import db
+from ..images import IMAGE_VARIANTS, variant_name
+
+bp = Blueprint('core', __name__)
+
+
+@bp.before_app_request
+def handle_options():
+    """Answer CORS preflight requests for every route"""
+    if request.method == 'OPTIONS':
+        response = current_app.make_default_options_response()
+        headers = response.headers
+        origin = request.headers.get('Origin', '*')
+        allowed_origins = current_app.config['CORS_ORIGINS']
+        
+        if origin in allowed_origins:
+            headers['Access-Control-Allow-Origin'] = origin
+        else:
+            headers['Access-Control-Allow-Origin'] = allowed_origins[0]
+            
+        headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, PATCH, OPTIONS'
+        headers['Access-Control-Allow-Headers'] = 'Authorization, Content-Type'
+        headers['Access-Control-Allow-Credentials'] = 'true'
+        return response
+
+
+@bp.route('/', methods=['GET'])
+def index():
+    """API Information"""
+    return jsonify({
+        'success': True,
+        'message': 'Flask Authentication API',
+        'version': '2.0',
+        'endpoints': {
+            'auth': {
+                'register': 'POST /api/auth/register',
+                'verify-email': 'POST /api/auth/verify-email',
+                'resend-code': 'POST /api/auth/resend-code',
+                'login': 'POST /api/auth/login'
+            },
+            'protected': {
+                'dashboard': 'GET /api/dashboard'
+            }
+        }
+    }), 200
+
+@bp.route('/api/health', methods=['GET'])
+def health():
+    """Health check endpoint"""
+    return jsonify({
+        'success': True,
+        'status': 'healthy',
+        'timestamp': datetime.utcnow(),
+        'pool': pool_status(db.engine),
+        'replica_pools': {key: pool_status(db.engines[key]) for key in current_app.config['DB_REPLICA_KEYS']}
+    }), 200
+
+
+# Content-addressed uploads (<sha256>.<ext> and their .<variant>.<ext>) never change
+CONTENT_ADDRESSED = re.compile(r'^[0-9a-f]{64}\.')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+MUTABLE_CACHE = 'public, max-age=3600'
+FALLBACK_CACHE = 'public, max-age=60'
+
+
+def _pick_variant(uploads_dir, filename):
+    """The generated variant asked for by ?variant=, or None to serve the original"""
+    variant = request.args.get('variant')
+    if variant not in IMAGE_VARIANTS:
+        return None
+    image_format = request.args.get('format')
+    webp = image_format == 'webp' or (image_format is None and request.accept_mimetypes['image/webp'])
+    candidates = [variant_name(filename, variant, webp=True)] if webp else []
+    candidates.append(variant_name(filename, variant))
+    for candidate in candidates:
+        path = safe_join(uploads_dir, candidate)
+        if path and os.path.isfile(path):
+            return candidate
+    return None
+
+
+@bp.route('/uploads/<path:filename>')
+def uploaded_file(filename):
+    """
+    Serve uploaded files from the uploads directory. `?variant=thumbnail|card|full`
+    serves a resized variant once generated (WebP when `format=webp` or the
+    browser accepts it), falling back to the original.
+
+    Content-addressed files are served as immutable. The bytes are sent by
+    nginx (UPLOAD_ACCEL_REDIRECT), the front server (USE_X_SENDFILE), or by
+    the WSGI server's file wrapper (sendfile under gunicorn); Range and
+    conditional requests are honoured on every path.
+    """
+    uploads_dir = current_app.config['UPLOAD_ROOT']
+    variant = _pick_variant(uploads_dir, filename)
+    served = variant or filename
+    path = safe_join(uploads_dir, served)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    if request.args.get('variant') in IMAGE_VARIANTS and variant is None:
+        cache_control = FALLBACK_CACHE  # the variant may exist on the next request
+    elif CONTENT_ADDRESSED.match(os.path.basename(served)):
+        cache_control = IMMUTABLE_CACHE
+    else:
+        cache_control = MUTABLE_CACHE
+
+    mimetype = mimetypes.guess_type(served)[0] or 'application/octet-stream'
+
+    accel_prefix = current_app.config['UPLOAD_ACCEL_REDIRECT']
+    if accel_prefix:
+        response = current_app.response_class(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{served}"
+    else:
+        response = send_file(path, mimetype=mimetype, conditional=True)
+    response.headers['Cache-Control'] = cache_control
+    if variant:
+        response.vary.add('Accept')
+    return response
+
+
+@bp.app_errorhandler(404)
+def not_found(error):
+    return jsonify({'success': False, 'message': 'Endpoint not found'}), 404
+
+@bp.app_errorhandler(500)
+def internal_error(error):
+    db.session.rollback()
+    return jsonify({'success': False, 'message': 'Internal server error'}), 500
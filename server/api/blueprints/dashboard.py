@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+from flask import Blueprint, jsonify, request
+from sqlalchemy import func, case
+
+from ..extensions import db
+from ..models import BOOKING_STATUSES, STAFF_ROLES, DailyStat, User
+from ..ratelimit import get_rate_limiter
+from ..routing import read_replica
+from ..security import role_required, token_required
+
+bp = Blueprint('dashboard', __name__)
+
+
+@bp.route('/api/dashboard', methods=['GET'])
+@token_required
+@read_replica()
+def dashboard(current_user):
+    """Get dashboard data - Protected route"""
+    try:
+        user_counters = get_user_counters(staff=False)
+        return jsonify({
+            'success': True,
+            'message': 'Dashboard data retrieved successfully',
+            'user': current_user.to_dict(),
+            'stats': {
+                'total_users': user_counters['total'],
+                'verified_users': user_counters['verified']
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Dashboard Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to load dashboard'}), 500
+
+
+def get_daily_series(days):
+    """
+    Bookings, completed revenue and user registrations per day for the last
+    `days` calendar days (today included), read from the daily_stats rollup.
+    Days without any rows are filled with zeros.
+    """
+    first_day = datetime.utcnow().date() - timedelta(days=days - 1)
+    stats = {stat.day: stat for stat in DailyStat.query.filter(DailyStat.day >= first_day)}
+
+    series = {'bookings': [], 'revenue': [], 'users': []}
+    for i in range(days):
+        day = first_day + timedelta(days=i)
+        stat = stats.get(day)
+        date_str = day.strftime('%Y-%m-%d')
+        series['bookings'].append({'date': date_str, 'bookings': stat.bookings if stat else 0})
+        series['revenue'].append({'date': date_str, 'revenue': float(stat.revenue) if stat else 0.0})
+        series['users'].append({'date': date_str, 'users': stat.users if stat else 0})
+
+    return series
+
+
+def get_status_distribution():
+    """All-time booking count per status, summed from the daily_stats rollup"""
+    totals = db.session.query(
+        *[func.coalesce(func.sum(getattr(DailyStat, status)), 0) for status in BOOKING_STATUSES]
+    ).one()
+    return dict(zip(BOOKING_STATUSES, totals))
+
+
+def get_user_counters(staff=True):
+    """
+    User totals summed from the daily_stats rollup. With `staff`, also the
+    admin and moderator counts, read from the ix_users_staff_status partial index.
+    """
+    total, verified = db.session.query(
+        func.coalesce(func.sum(DailyStat.users), 0),
+        func.coalesce(func.sum(DailyStat.verified), 0)
+    ).one()
+    counters = {'total': total, 'verified': verified}
+    if staff:
+        roles = dict(db.session.query(User.status, func.count()).filter(db.text(STAFF_ROLES)).group_by(User.status))
+        counters.update(admins=roles.get('admin', 0), moderators=roles.get('moderator', 0))
+    return counters
+
+
+def get_booking_counters():
+    """All booking counters and completed revenue in one aggregate over daily_stats"""
+    seven_days_ago = datetime.utcnow().date() - timedelta(days=6)
+    total, *status_counts, revenue, recent = db.session.query(
+        func.coalesce(func.sum(DailyStat.bookings), 0),
+        *[func.coalesce(func.sum(getattr(DailyStat, status)), 0) for status in BOOKING_STATUSES],
+        func.coalesce(func.sum(DailyStat.revenue), 0),
+        func.coalesce(func.sum(case((DailyStat.day >= seven_days_ago, DailyStat.bookings), else_=0)), 0)
+    ).one()
+
+    counters = {'total': total, **dict(zip(BOOKING_STATUSES, status_counts)), 'recent_7_days': recent}
+    return counters, float(revenue)
+
+
+def get_dashboard_summary():
+    """Summary payload for the admin dashboard: three queries regardless of table size"""
+    booking_counters, revenue = get_booking_counters()
+    return {
+        'users': get_user_counters(),
+        'bookings': booking_counters,
+        'revenue': {'total': revenue}
+    }
+
+
+@bp.route('/api/dashboard/summary', methods=['GET'])
+@role_required(['admin', 'moderator'])
+@read_replica()
+def dashboard_summary(current_user):
+    """Get dashboard summary statistics - Admin/Moderator only"""
+    try:
+        return jsonify({
+            'success': True,
+            'summary': get_dashboard_summary()
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Dashboard Summary Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to load dashboard summary'}), 500
+
+
+@bp.route('/api/dashboard/charts', methods=['GET'])
+@role_required(['admin', 'moderator'])
+@read_replica()
+def dashboard_charts(current_user):
+    """Get chart data for dashboard - Admin/Moderator only"""
+    try:
+        range_type = request.args.get('range', '7d')  # 7d, 30d, 90d
+        
+        days = 7
+        if range_type == '30d':
+            days = 30
+        elif range_type == '90d':
+            days = 90
+        
+        series = get_daily_series(days)
+        
+        return jsonify({
+            'success': True,
+            'charts': {
+                'bookings_over_time': series['bookings'],
+                'revenue_over_time': series['revenue'],
+                'users_over_time': series['users'],
+                'booking_status_distribution': get_status_distribution()
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Dashboard Charts Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to load chart data'}), 500
+
+
+@bp.route('/api/dashboard/rate-limits', methods=['GET'])
+@role_required(['admin'])
+def rate_limit_stats(current_user):
+    """Rate limiter counters: allowed/rejected per endpoint and current hits per key - Admin only"""
+    try:
+        return jsonify({
+            'success': True,
+            'rate_limits': get_rate_limiter().stats()
+        }), 200
+
+    except Exception as e:
+        print(f"❌ Rate Limit Stats Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to load rate limit stats'}), 500
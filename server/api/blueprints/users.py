@@ -0,0 +1,172 @@
+from flask import Blueprint, jsonify, request
+
+from ..export import get_export_args, stream_export
+from ..extensions import db
+from ..models import User
+from ..pagination import get_page_args, paginate_keyset
+from ..passwords import PasswordHasherBusy, get_password_hasher
+from ..routing import read_replica
+from ..security import generate_token, invalidate_auth_state, role_required, token_required
+
+bp = Blueprint('users', __name__)
+
+
+@bp.route('/api/users', methods=['GET'])
+@role_required(['admin', 'moderator'])
+def get_users(current_user):
+    """Get users, newest first, one page at a time - Protected route (admin/moderator only)"""
+    try:
+        limit, cursor = get_page_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        users, next_cursor = paginate_keyset(User.query, User, limit, cursor)
+        users_list = [user.to_dict() for user in users]
+        
+        return jsonify({
+            'success': True,
+            'users': users_list,
+            'next_cursor': next_cursor
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Get Users Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to fetch users'}), 500
+
+
+@bp.route('/api/users/export', methods=['GET'])
+@role_required(['admin', 'moderator'])
+@read_replica()
+def export_users(current_user):
+    """Stream users as NDJSON or CSV, filtered by role and registration date - Admin/Moderator only"""
+    try:
+        export_format, start, end = get_export_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    try:
+        columns = [User.id, User.name, User.email, User.status, User.is_verified, User.created_at, User.last_login]
+        query = db.session.query(*columns)
+        status = request.args.get('status')
+        if status:
+            query = query.filter(User.status == status)
+        if start:
+            query = query.filter(User.created_at >= start)
+        if end:
+            query = query.filter(User.created_at < end)
+
+        return stream_export(query.order_by(User.created_at, User.id), [column.key for column in columns],
+                             export_format, 'users')
+    except Exception as e:
+        print(f"❌ Export Users Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to export users'}), 500
+
+
+@bp.route('/api/users/<int:user_id>/role', methods=['PATCH'])
+@role_required(['admin'])
+def update_user_role(current_user, user_id):
+    """Update user role - Admin only"""
+    try:
+        data = request.get_json()
+        new_role = data.get('role', '').strip().lower()
+        
+        if new_role not in ['admin', 'moderator', 'user']:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid role. Must be admin, moderator, or user'
+            }), 400
+        
+        target_user = User.query.get(user_id)
+        if not target_user:
+            return jsonify({'success': False, 'message': 'User not found'}), 404
+        
+        # Prevent self-demotion if last admin
+        if target_user.id == current_user.id and new_role != 'admin':
+            admin_count = User.query.filter_by(status='admin').count()
+            if admin_count <= 1:
+                return jsonify({
+                    'success': False,
+                    'message': 'Cannot demote yourself. At least one admin must remain.'
+                }), 400
+        
+        target_user.status = new_role
+        db.session.commit()
+        invalidate_auth_state(target_user.id)
+        
+        return jsonify({
+            'success': True,
+            'message': f'User role updated to {new_role}',
+            'user': target_user.to_dict()
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Role Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to update user role'}), 500
+
+@bp.route('/api/users/profile', methods=['PUT'])
+@token_required
+def update_profile(current_user):
+    """Update user profile - Authenticated users only"""
+    try:
+        data = request.get_json()
+        
+        name = data.get('name', '').strip()
+        
+        if not name:
+            return jsonify({'success': False, 'message': 'Name is required'}), 400
+        
+        current_user.name = name
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': 'Profile updated successfully',
+            'user': current_user.to_dict()
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Update Profile Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to update profile'}), 500
+
+
+@bp.route('/api/users/change-password', methods=['PUT'])
+@token_required
+def change_password(current_user):
+    """Change user password - Authenticated users only"""
+    try:
+        data = request.get_json()
+        
+        current_password = data.get('current_password', '')
+        new_password = data.get('new_password', '')
+        
+        if not current_password or not new_password:
+            return jsonify({'success': False, 'message': 'Both passwords are required'}), 400
+        
+        if len(new_password) < 6:
+            return jsonify({'success': False, 'message': 'New password must be at least 6 characters'}), 400
+        
+        # Verify current password
+        password_hasher = get_password_hasher()
+        if not password_hasher.verify(current_user.password, current_password):
+            return jsonify({'success': False, 'message': 'Current password is incorrect'}), 401
+        
+        # Update password and revoke previously issued tokens
+        current_user.password = password_hasher.hash(new_password)
+        current_user.token_version = (current_user.token_version or 0) + 1
+        db.session.commit()
+        invalidate_auth_state(current_user.id)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Password changed successfully',
+            'token': generate_token(current_user)
+        }), 200
+        
+    except PasswordHasherBusy:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Server is busy, please try again shortly'}), 503
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Change Password Error: {str(e)}")
+        return jsonify({'success': False, 'message': 'Failed to change password'}), 500
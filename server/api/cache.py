@@ -0,0 +1,149 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after being set"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class MemoryCacheBackend:
+    """Per-process response cache with version counters for tag invalidation"""
+
+    def __init__(self, maxsize, ttl):
+        self._entries = TTLCache(maxsize, ttl)
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        self._entries.set(key, value)
+
+    def get_versions(self, tags):
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    def bump_version(self, tag):
+        with self._lock:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class RedisCacheBackend:
+    """Response cache shared by all workers through Redis (or any Redis-compatible server)"""
+
+    def __init__(self, url, ttl):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('RESPONSE_CACHE_URL is set but the redis package is not installed')
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key):
+        return self._client.get(f'response:{key}')
+
+    def set(self, key, value):
+        self._client.setex(f'response:{key}', self.ttl, value)
+
+    def get_versions(self, tags):
+        return [int(version or 0) for version in self._client.mget([f'version:{tag}' for tag in tags])]
+
+    def bump_version(self, tag):
+        self._client.incr(f'version:{tag}')
+
+
+def init_app(app):
+    """
+    Attach the response cache backend selected by RESPONSE_CACHE_URL to `app`.
+    In-memory invalidations don't reach other workers, so with more than one
+    the entries only live RESPONSE_CACHE_LOCAL_TTL seconds.
+    """
+    ttl = app.config['RESPONSE_CACHE_TTL']
+    if app.config['RESPONSE_CACHE_URL']:
+        backend = RedisCacheBackend(app.config['RESPONSE_CACHE_URL'], ttl)
+    else:
+        if app.config['WEB_CONCURRENCY'] > 1:
+            ttl = min(ttl, app.config['RESPONSE_CACHE_LOCAL_TTL'])
+        backend = MemoryCacheBackend(app.config['RESPONSE_CACHE_SIZE'], ttl)
+    app.extensions['response_cache'] = backend
+
+def get_response_cache():
+    return current_app.extensions['response_cache']
+
+def cached_response(*tags):
+    """
+    Cache a public JSON endpoint's 200 responses per query string and serve
+    them with a strong ETag, answering If-None-Match with 304. Entries are
+    keyed on the current version of each tag, so invalidate_cache(tag)
+    retires them all at once.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            response_cache = get_response_cache()
+            versions = response_cache.get_versions(tags)
+            # Encoded, so a value containing '&' or '=' can't collide with another query
+            query = urlencode(sorted(request.args.items(multi=True)))
+            key = f"{f.__name__}:{':'.join(map(str, versions))}:{query}"
+
+            entry = response_cache.get(key)
+            if entry is None:
+                response = current_app.make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+                response_cache.set(key, etag.encode() + b':' + body)
+            else:
+                etag, body = entry.split(b':', 1)
+                etag = etag.decode()
+
+            response = current_app.response_class(body, mimetype='application/json')
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'public, no-cache'
+            return response.make_conditional(request)
+        return decorated
+    return decorator
+
+def invalidate_cache(tag):
+    """Retire every cached response that depends on `tag`"""
+    get_response_cache().bump_version(tag)
@@ -0,0 +1,159 @@
+import os
+import re
+import time
+from datetime import datetime, timedelta
+
+import click
+
+from flask_mail import Message
+
+from .audit import audit_queries
+from .emails import get_email_templates, get_mail_dispatcher
+from .extensions import db
+from .images import IMAGE_FIELDS, get_image_pipeline
+from .migrations import MIGRATIONS_DIR, available_revisions, current_version, init_db, latest_version, upgrade
+from .models import User
+from .rollup import check_daily_stats, rebuild_daily_stats
+from .seed import seed_database
+from .security import generate_verification_code
+from .storage import collect_garbage
+
+
+def register_commands(app):
+    def print_applied(applied):
+        for version, description, seconds in applied:
+            print(f"✅ {version:04d} {description} ({seconds:.1f}s)")
+
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create the schema or upgrade it to the newest revision (same as db-upgrade)"""
+        print_applied(init_db())
+        print("✅ Database initialized successfully")
+
+    @app.cli.command('db-upgrade')
+    @click.option('--target', type=int, help='Stop after this revision (default: the newest)')
+    def db_upgrade_command(target):
+        """Apply pending schema migrations"""
+        applied = upgrade(target)
+        print_applied(applied)
+        if not applied:
+            print("✅ Schema is up to date")
+
+    @app.cli.command('db-status')
+    def db_status_command():
+        """Show the database's schema version and any pending revisions"""
+        with db.engine.connect() as connection:
+            current = current_version(connection)
+        print(f"📦 Schema version {current} (newest revision {latest_version()})")
+        for version, name in available_revisions().items():
+            if version > current:
+                print(f"   pending: {name}")
+
+    @app.cli.command('db-revision')
+    @click.argument('description')
+    def db_revision_command(description):
+        """Create an empty migration file for the next revision"""
+        version = latest_version() + 1
+        slug = re.sub(r'[^a-z0-9]+', '_', description.lower()).strip('_')[:40]
+        path = os.path.join(MIGRATIONS_DIR, f'{version:04d}_{slug}.py')
+        with open(path, 'x') as f:
+            f.write(f'"""{description}"""\n\n\ndef upgrade(op):\n    pass\n')
+        print(f"✅ Created {path}")
+
+    @app.cli.command('rebuild-daily-stats')
+    def rebuild_daily_stats_command():
+        """Backfill the daily_stats rollup from a full recount"""
+        days = rebuild_daily_stats()
+        print(f"✅ Rebuilt daily_stats: {days} days")
+
+    @app.cli.command('check-daily-stats')
+    def check_daily_stats_command():
+        """Compare the daily_stats rollup against a full recount"""
+        mismatches = check_daily_stats()
+        if not mismatches:
+            print("✅ daily_stats is consistent")
+            return
+        for mismatch in mismatches:
+            print(f"❌ {mismatch['day']}: {mismatch['fields']}")
+        raise SystemExit(1)
+
+    @app.cli.command('process-images')
+    def process_images_command():
+        """Generate missing variants for uploaded car and content images"""
+        image_pipeline = get_image_pipeline()
+        processed = 0
+        for model, (url_column, variants_column, _) in IMAGE_FIELDS.items():
+            url = getattr(model, url_column)
+            rows = model.query.filter(url.like('/uploads/%'), getattr(model, variants_column).is_(None)).all()
+            for row in rows:
+                try:
+                    setattr(row, variants_column, image_pipeline.render(getattr(row, url_column)))
+                    processed += 1
+                except Exception as e:
+                    print(f"❌ {model.__tablename__} {row.id}: {str(e)}")
+        db.session.commit()
+        print(f"✅ Generated variants for {processed} images")
+
+    @app.cli.command('gc-uploads')
+    @click.option('--grace-seconds', default=3600, help='Keep unreferenced files younger than this')
+    @click.option('--dry-run', is_flag=True, help='Report what would be removed without deleting')
+    def gc_uploads_command(grace_seconds, dry_run):
+        """Delete uploads no row references any more, and their variants"""
+        removed, freed = collect_garbage(grace_seconds, dry_run=dry_run)
+        action = 'Would remove' if dry_run else 'Removed'
+        print(f"✅ {action} {removed} files ({freed / 1024 / 1024:.1f} MB)")
+
+    @app.cli.command('resend-verification-codes')
+    def resend_verification_codes_command():
+        """Send fresh verification codes to every unverified user"""
+        users = User.query.filter_by(is_verified=False).all()
+        expires_at = datetime.utcnow() + timedelta(minutes=10)
+        for user in users:
+            user.verification_code = generate_verification_code()
+            user.code_expires_at = expires_at
+        db.session.commit()
+
+        mail_dispatcher = get_mail_dispatcher()
+        rendered = get_email_templates().render_many(
+            'verification', [{'name': user.name, 'code': user.verification_code} for user in users]
+        )
+        for user, (html, text) in zip(users, rendered):
+            mail_dispatcher.enqueue(
+                Message(subject='Verify Your Email Address', recipients=[user.email], html=html, body=text),
+                block=True
+            )
+        mail_dispatcher.shutdown(timeout=None)
+        print(f"✅ Sent verification codes to {len(users)} users")
+
+    @app.cli.command('seed-data')
+    @click.option('--users', default=100000, help='Users to add (the first is an admin)')
+    @click.option('--bookings', default=1000000, help='Bookings to add')
+    @click.option('--cars', default=200, help='Cars to add')
+    @click.option('--yes', is_flag=True, help='Skip the confirmation prompt')
+    def seed_data_command(users, bookings, cars, yes):
+        """Bulk-insert synthetic users, bookings and cars for benchmarks and audit-queries"""
+        if not yes:
+            click.confirm(f"Add {users:,} users, {bookings:,} bookings and {cars:,} cars to "
+                          f"{db.engine.url.render_as_string()}?", abort=True)
+        started = time.perf_counter()
+        admin_email = seed_database(users, bookings, cars)
+        print(f"✅ Seeded in {time.perf_counter() - started:.0f}s; admin: {admin_email} / password")
+
+    @app.cli.command('audit-queries')
+    @click.option('--min-rows', default=10000, help='Ignore sequential scans of tables smaller than this')
+    def audit_queries_command(min_rows):
+        """EXPLAIN the read endpoints' queries and flag sequential scans"""
+        try:
+            findings = audit_queries(min_rows)
+        except RuntimeError as e:
+            print(f"❌ {str(e)}")
+            raise SystemExit(1)
+        unexpected = [finding for finding in findings if not finding['expected']]
+        for finding in findings:
+            icon = 'ℹ️ ' if finding['expected'] else '❌'
+            print(f"{icon} {finding['path']}: Seq Scan on {finding['table']} ({finding['rows']:,} rows)")
+            if not finding['expected']:
+                print(f"     {finding['statement'][:300]}")
+        if unexpected:
+            raise SystemExit(1)
+        print("✅ No unexpected sequential scans")
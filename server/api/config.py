@@ -0,0 +1,126 @@
+import os
+
+from dotenv import load_dotenv
+
+from .database import normalize_database_url
+
+load_dotenv()
+
+CPU_COUNT = os.cpu_count() or 1
+# Processes serving requests, as gunicorn.conf.py starts them
+WEB_WORKERS = int(os.environ.get('WEB_CONCURRENCY', CPU_COUNT * 2 + 1))
+
+
+class Config:
+    """Default settings, read from the environment. create_app() can override any of them."""
+
+    # Processes serving requests; per-process caches and stores are checked against it
+    WEB_CONCURRENCY = WEB_WORKERS
+
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    SQLALCHEMY_DATABASE_URI = normalize_database_url(
+        os.environ.get('DATABASE_URL', "postgresql://postgres:postgres@db:5432/postgres")
+    )
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pool, per process (so per gunicorn worker). Ignored for SQLite.
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    # Milliseconds; 0 disables
+    DB_STATEMENT_TIMEOUT = int(os.environ.get('DB_STATEMENT_TIMEOUT', 30000))
+    # Set when connecting through PgBouncer in transaction mode
+    DB_EXTERNAL_POOLER = os.environ.get('DB_EXTERNAL_POOLER', 'false').lower() == 'true'
+    # Number of reverse proxies in front of the app (e.g. 1 behind nginx or a load
+    # balancer). Their X-Forwarded-For/-Proto/-Host headers are trusted that many hops
+    # deep, so request.remote_addr is the client's IP; 0 trusts none of them.
+    TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+    # gunicorn refuses to start while migrations are pending (one version query)
+    SCHEMA_VERSION_CHECK = os.environ.get('SCHEMA_VERSION_CHECK', 'true').lower() == 'true'
+
+    # Comma-separated read replica URLs for @read_replica views. Reads return to the
+    # primary for DB_REPLICA_STICKY_SECONDS after a write they could otherwise miss.
+    # Those writes are recorded in Redis at DB_REPLICA_STICKY_URL so every worker sees
+    # them; the in-memory fallback is only allowed with a single worker.
+    DB_REPLICA_URLS = [normalize_database_url(url.strip())
+                       for url in os.environ.get('DB_REPLICA_URLS', '').split(',') if url.strip()]
+    DB_REPLICA_STICKY_SECONDS = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 10))
+    DB_REPLICA_STICKY_URL = os.environ.get('DB_REPLICA_STICKY_URL')
+
+    # Password hashing: scrypt:N:r:p, pbkdf2:sha256:iterations or argon2:time:memory_kib:parallelism.
+    # Hashes made with other settings are upgraded on the user's next login.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    # Hashing threads and queued hashes, per process: the defaults split the CPUs
+    # and a 64-hash queue across WEB_CONCURRENCY workers.
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', max(1, CPU_COUNT // WEB_WORKERS)))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING',
+                                                   max(PASSWORD_HASH_WORKERS, 64 // WEB_WORKERS)))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10.0))
+
+    # CORS
+    CORS_ORIGINS = os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
+
+    # Authenticated user lookups are cached per process for AUTH_CACHE_TTL seconds.
+    # A role change, logout-everywhere or password reset only clears the cache of the
+    # worker that handled it, so other workers honour the old role or revoked tokens
+    # for up to AUTH_CACHE_TTL seconds, so keep it short.
+    AUTH_CACHE_TTL = int(os.environ.get('AUTH_CACHE_TTL', 5))
+    AUTH_CACHE_SIZE = int(os.environ.get('AUTH_CACHE_SIZE', 1024))
+
+    # Public read responses are cached in memory, or in Redis when RESPONSE_CACHE_URL is set.
+    # A write only retires the in-memory entries of the worker that handled it; the others
+    # keep serving what they cached, so with more than one worker in-memory entries live
+    # RESPONSE_CACHE_LOCAL_TTL seconds instead. Set RESPONSE_CACHE_URL to share invalidations.
+    RESPONSE_CACHE_URL = os.environ.get('RESPONSE_CACHE_URL')
+    RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+    RESPONSE_CACHE_LOCAL_TTL = int(os.environ.get('RESPONSE_CACHE_LOCAL_TTL', 5))
+    RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 512))
+
+    # Auth endpoint throttling, as "count/seconds" per client IP and per email.
+    # Counters live in memory, or in Redis when RATE_LIMIT_URL is set. In-memory counters
+    # are per gunicorn worker, so each limit is effectively multiplied by WEB_CONCURRENCY;
+    # set RATE_LIMIT_URL to share them.
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+    RATE_LIMIT_URL = os.environ.get('RATE_LIMIT_URL')
+    RATE_LIMIT_MAX_KEYS = int(os.environ.get('RATE_LIMIT_MAX_KEYS', 100000))
+    RATE_LIMIT_LOGIN_IP = os.environ.get('RATE_LIMIT_LOGIN_IP', '30/60')
+    RATE_LIMIT_LOGIN_EMAIL = os.environ.get('RATE_LIMIT_LOGIN_EMAIL', '5/60')
+    RATE_LIMIT_VERIFY_EMAIL_IP = os.environ.get('RATE_LIMIT_VERIFY_EMAIL_IP', '30/60')
+    RATE_LIMIT_VERIFY_EMAIL_EMAIL = os.environ.get('RATE_LIMIT_VERIFY_EMAIL_EMAIL', '5/600')
+    RATE_LIMIT_RESEND_CODE_IP = os.environ.get('RATE_LIMIT_RESEND_CODE_IP', '10/60')
+    RATE_LIMIT_RESEND_CODE_EMAIL = os.environ.get('RATE_LIMIT_RESEND_CODE_EMAIL', '3/600')
+
+    MAIL_SERVER = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
+    MAIL_PORT = int(os.environ.get('MAIL_PORT', 587))
+    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'true').lower() == 'true'
+    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER', os.environ.get('MAIL_USERNAME'))
+
+    # Outgoing mail is handed to a background dispatcher instead of blocking the request
+    MAIL_QUEUE_SIZE = int(os.environ.get('MAIL_QUEUE_SIZE', 1000))
+    MAIL_WORKERS = int(os.environ.get('MAIL_WORKERS', 2))
+    MAIL_MAX_RETRIES = int(os.environ.get('MAIL_MAX_RETRIES', 3))
+    MAIL_RETRY_BACKOFF = float(os.environ.get('MAIL_RETRY_BACKOFF', 1.0))
+    MAIL_IDLE_TIMEOUT = float(os.environ.get('MAIL_IDLE_TIMEOUT', 30.0))
+
+    # File Upload Configuration
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+    # Image uploads are checked while streaming and abandoned past this size
+    UPLOAD_MAX_FILE_SIZE = int(os.environ.get('UPLOAD_MAX_FILE_SIZE', 10 * 1024 * 1024))
+
+    # Hand /uploads bytes to the front server instead of a Python worker: an nginx
+    # `internal` location prefix mapped to the uploads directory (X-Accel-Redirect),
+    # or X-Sendfile for Apache/lighttpd. Without either, gunicorn uses sendfile().
+    UPLOAD_ACCEL_REDIRECT = os.environ.get('UPLOAD_ACCEL_REDIRECT')
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
+
+    # Resized/WebP variants of uploaded images are generated by this many background threads
+    IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', 2))
+    IMAGE_QUALITY = int(os.environ.get('IMAGE_QUALITY', 80))
+
+    # /api/bookings/search ranks only the newest this many matches, so very common
+    # terms cost the same as rare ones; the response says `truncated` when it drops any
+    SEARCH_MAX_CANDIDATES = int(os.environ.get('SEARCH_MAX_CANDIDATES', 2000))
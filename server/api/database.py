@@ -0,0 +1,57 @@
+"""
+Engine configuration.
+
+Pool settings come from the DB_* config keys. With DB_EXTERNAL_POOLER
+(PgBouncer in transaction mode) the app keeps no pool of its own and avoids
+per-session state. SQLite gets SQLAlchemy's defaults.
+"""
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+
+def normalize_database_url(url):
+    """Accept the `postgres://` scheme some hosts still hand out."""
+    if url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def build_engine_options(config, url=None):
+    """Engine options for `url`, the configured database URL by default."""
+    url = make_url(url or config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() != 'postgresql':
+        return {}
+
+    connect_args = {}
+    if config['DB_EXTERNAL_POOLER']:
+        options = {'poolclass': NullPool}
+        if url.get_driver_name() == 'psycopg':
+            # Prepared statements don't survive a transaction-mode pooler
+            connect_args['prepare_threshold'] = None
+        # Startup parameters are rejected by PgBouncer, so statement_timeout
+        # has to be set on the database role instead
+    else:
+        options = {
+            'pool_size': config['DB_POOL_SIZE'],
+            'max_overflow': config['DB_MAX_OVERFLOW'],
+            'pool_timeout': config['DB_POOL_TIMEOUT'],
+            'pool_recycle': config['DB_POOL_RECYCLE'],
+            'pool_pre_ping': config['DB_POOL_PRE_PING'],
+        }
+        if config['DB_STATEMENT_TIMEOUT']:
+            connect_args['options'] = f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT']}"
+
+    if connect_args:
+        options['connect_args'] = connect_args
+    return options
+
+
+def pool_status(engine):
+    """Connection counts for the engine's pool, without opening a connection."""
+    pool = engine.pool
+    status = {'class': type(pool).__name__}
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        method = getattr(pool, name, None)
+        if method is not None:
+            status[name] = method()
+    return status
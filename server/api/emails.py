@@ -0,0 +1,156 @@
+import atexit
+import os
+import queue
+import smtplib
+import threading
+import time
+
+from flask import current_app
+from flask_mail import Message
+
+from .extensions import mail
+
+
+class MailDispatcher:
+    """
+    Sends queued messages from a small pool of worker threads.
+
+    Each worker keeps one SMTP connection open across messages and closes it
+    after MAIL_IDLE_TIMEOUT seconds without work. Failed sends are retried
+    with exponential backoff on a fresh connection. Workers are started on
+    the first enqueue, so they are created in the process that uses them.
+    """
+
+    def __init__(self, app, mail):
+        self.app = app
+        self.mail = mail
+        self.queue = queue.Queue(maxsize=app.config['MAIL_QUEUE_SIZE'])
+        self.workers = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, message, block=False):
+        """Queue a message for delivery. Returns False when the queue is full."""
+        self._start()
+        try:
+            self.queue.put(message, block=block)
+            return True
+        except queue.Full:
+            print(f"❌ Email Error: mail queue full, dropping message to {message.recipients}")
+            return False
+
+    def _start(self):
+        if self.workers:
+            return
+        with self._lock:
+            if self.workers:
+                return
+            for i in range(self.app.config['MAIL_WORKERS']):
+                worker = threading.Thread(target=self._run, name=f'mail-worker-{i}', daemon=True)
+                worker.start()
+                self.workers.append(worker)
+
+    def shutdown(self, timeout=10):
+        """Let workers drain the queue, then stop them (timeout=None waits for all)"""
+        for _ in self.workers:
+            self.queue.put(None)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for worker in self.workers:
+            worker.join(max(0, deadline - time.monotonic()) if deadline is not None else None)
+        self.workers = []
+
+    def _run(self):
+        with self.app.app_context():
+            connection = None
+            while True:
+                try:
+                    message = self.queue.get(timeout=self.app.config['MAIL_IDLE_TIMEOUT'])
+                except queue.Empty:
+                    connection = self._close(connection)
+                    continue
+                if message is None:
+                    self._close(connection)
+                    return
+                connection = self._deliver(connection, message)
+
+    def _deliver(self, connection, message):
+        max_retries = self.app.config['MAIL_MAX_RETRIES']
+        for attempt in range(max_retries + 1):
+            try:
+                if connection is None:
+                    connection = self.mail.connect().__enter__()
+                connection.send(message)
+                return connection
+            except (smtplib.SMTPException, OSError) as e:
+                connection = self._close(connection)
+                if attempt == max_retries:
+                    print(f"❌ Email Error: giving up on {message.recipients}: {str(e)}")
+                    return None
+                time.sleep(self.app.config['MAIL_RETRY_BACKOFF'] * 2 ** attempt)
+            except Exception as e:
+                print(f"❌ Email Error: {str(e)}")
+                return connection
+
+    @staticmethod
+    def _close(connection):
+        if connection is not None and connection.host is not None:
+            try:
+                connection.host.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+        return None
+
+
+class EmailTemplates:
+    """
+    Transactional email templates under templates/email/, compiled once at
+    startup. Each email has an HTML part (<name>.html) and an optional
+    plain-text alternative (<name>.txt).
+    """
+
+    def __init__(self, app, folder='email'):
+        self.app = app
+        self.templates = {}
+        template_dir = os.path.join(app.root_path, app.template_folder, folder)
+        for filename in sorted(os.listdir(template_dir)):
+            name, ext = os.path.splitext(filename)
+            if name == 'base' or ext not in ('.html', '.txt'):
+                continue
+            parts = self.templates.setdefault(name, {})
+            parts[ext[1:]] = app.jinja_env.get_template(f'{folder}/{filename}')
+
+    def render(self, template, **context):
+        """Render one email, returning (html, text); text is None without a .txt part"""
+        parts = self.templates[template]
+        text = parts['txt'].render(**context) if 'txt' in parts else None
+        return parts['html'].render(**context), text
+
+    def render_many(self, template, contexts):
+        """Render the same email for many recipients"""
+        return [self.render(template, **context) for context in contexts]
+
+    def build(self, template, subject, recipient, **context):
+        """Render an email into a ready-to-queue Message"""
+        html, text = self.render(template, **context)
+        return Message(subject=subject, recipients=[recipient], html=html, body=text)
+
+
+def init_app(app):
+    """Compile the email templates and attach a mail dispatcher to `app`"""
+    app.extensions['email_templates'] = EmailTemplates(app)
+    dispatcher = app.extensions['mail_dispatcher'] = MailDispatcher(app, mail)
+    atexit.register(dispatcher.shutdown)
+
+def get_email_templates():
+    return current_app.extensions['email_templates']
+
+def get_mail_dispatcher():
+    return current_app.extensions['mail_dispatcher']
+
+def send_verification_email(email, code, name):
+    """Queue a verification code email. Returns False if it could not be queued."""
+    try:
+        msg = get_email_templates().build('verification', 'Verify Your Email Address', email, name=name, code=code)
+        return get_mail_dispatcher().enqueue(msg)
+    except Exception as e:
+        print(f"❌ Email Error: {str(e)}")
+        return False
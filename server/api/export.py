@@ -0,0 +1,61 @@
+import csv
+import io
+from datetime import datetime, date, timedelta
+
+from flask import current_app, request, stream_with_context
+
+
+EXPORT_MIMETYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_BATCH_SIZE = 1000
+
+def get_export_args():
+    """
+    Read `format` (ndjson|csv) and the inclusive `from`/`to` dates (YYYY-MM-DD)
+    of an export request. Raises ValueError on bad input.
+    """
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in EXPORT_MIMETYPES:
+        raise ValueError('Invalid format. Allowed: ndjson, csv')
+    try:
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+        start = datetime.combine(date.fromisoformat(date_from), datetime.min.time()) if date_from else None
+        end = datetime.combine(date.fromisoformat(date_to) + timedelta(days=1), datetime.min.time()) if date_to else None
+    except ValueError:
+        raise ValueError('Invalid date format. Use YYYY-MM-DD')
+    return export_format, start, end
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def stream_export(query, columns, export_format, filename):
+    """
+    Stream `query` rows as NDJSON or CSV. Rows are fetched in batches of
+    EXPORT_BATCH_SIZE through a server-side cursor and written out batch by
+    batch, so memory stays flat regardless of table size.
+    """
+    def generate():
+        rows = query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        buffer = io.StringIO()
+        if export_format == 'csv':
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+        for i, row in enumerate(rows, 1):
+            if export_format == 'csv':
+                writer.writerow([_csv_value(value) for value in row])
+            else:
+                buffer.write(current_app.json.dumps(dict(zip(columns, row))))
+                buffer.write('\n')
+            if i % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    response = current_app.response_class(stream_with_context(generate()), mimetype=EXPORT_MIMETYPES[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}.{export_format}'
+    return response
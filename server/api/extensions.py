@@ -0,0 +1,10 @@
+from flask_cors import CORS
+from flask_mail import Mail
+from flask_sqlalchemy import SQLAlchemy
+
+from .routing import RoutingSession
+
+# Created unbound; create_app() attaches them to an application
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+mail = Mail()
+cors = CORS()
@@ -0,0 +1,147 @@
+"""
+Image variants for uploaded car and content images.
+
+After an upload is committed, the original is resized in a background
+thread into each IMAGE_VARIANTS size, saved both in its original format and
+as WebP next to the original (`<name>.<variant>.<ext>` / `<name>.<variant>.webp`).
+The variant URLs are then stored on the row (Car.image_variants,
+ContentBlock.media_variants) and the matching response cache retired.
+Requests for /uploads/...?variant=card are served the variant once it exists.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from .cache import invalidate_cache
+from .extensions import db
+from .models import Car, ContentBlock
+from .utils import upload_path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+# Largest first: each variant is resized from the one before it
+IMAGE_VARIANTS = {
+    'full': (1600, 1600),
+    'card': (640, 480),
+    'thumbnail': (200, 200),
+}
+
+# model -> (source URL column, variants column, response cache tag)
+IMAGE_FIELDS = {
+    Car: ('image_url', 'image_variants', 'cars'),
+    ContentBlock: ('media_url', 'media_variants', 'content'),
+}
+
+
+def variant_name(filename, variant, webp=False):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{variant}{'.webp' if webp else ext}"
+
+def variant_paths(path):
+    """Every file the pipeline may generate for the upload at `path`"""
+    return [variant_name(path, variant, webp) for variant in IMAGE_VARIANTS for webp in (False, True)]
+
+
+class ImagePipeline:
+    """Generates image variants on a small pool of worker threads"""
+
+    def __init__(self, app, workers, quality):
+        self.app = app
+        self.workers = workers
+        self.quality = quality
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Created on first use in each process, so forked workers get their own threads
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='image-pipeline')
+                self._pid = os.getpid()
+            return self._executor
+
+    def schedule(self, row):
+        """Queue variant generation for a committed Car or ContentBlock. Returns False if skipped."""
+        url_column = IMAGE_FIELDS[type(row)][0]
+        url = getattr(row, url_column)
+        if Image is None or not url or not url.startswith('/uploads/'):
+            return False
+        self._get_executor().submit(self._process, type(row), row.id, url)
+        return True
+
+    def render(self, url):
+        """Write every variant of the upload at `url` and return their URLs and sizes"""
+        path = upload_path(url)
+        url_dir, basename = url.rsplit('/', 1)
+
+        def entry(variant, image):
+            return {
+                'url': f"{url_dir}/{variant_name(basename, variant)}",
+                'webp': f"{url_dir}/{variant_name(basename, variant, webp=True)}",
+                'width': image.width,
+                'height': image.height,
+            }
+
+        if all(os.path.exists(variant_path) for variant_path in variant_paths(path)):
+            # Uploads are content-addressed, so identical content already has its variants
+            variants = {}
+            for variant in IMAGE_VARIANTS:
+                with Image.open(variant_name(path, variant)) as image:
+                    variants[variant] = entry(variant, image)
+            return variants
+
+        with Image.open(path) as original:
+            original.draft('RGB', IMAGE_VARIANTS['full'])  # JPEG: decode at reduced scale
+            image = ImageOps.exif_transpose(original)
+            image.load()
+            source_format = original.format
+
+        variants = {}
+        for variant, size in IMAGE_VARIANTS.items():
+            image.thumbnail(size, Image.LANCZOS, reducing_gap=3.0)
+            save_kwargs = {'optimize': True}
+            if source_format == 'JPEG':
+                save_kwargs['quality'] = self.quality
+            fallback = image if source_format != 'JPEG' or image.mode == 'RGB' else image.convert('RGB')
+            fallback.save(variant_name(path, variant), format=source_format, **save_kwargs)
+            webp = image if image.mode in ('RGB', 'RGBA') else image.convert('RGBA')
+            webp.save(variant_name(path, variant, webp=True), format='WEBP', quality=self.quality, method=4)
+            variants[variant] = entry(variant, image)
+        return variants
+
+    def _process(self, model, row_id, url):
+        url_column, variants_column, cache_tag = IMAGE_FIELDS[model]
+        with self.app.app_context():
+            try:
+                variants = self.render(url)
+            except Exception as e:
+                print(f"❌ Image Pipeline Error ({url}): {str(e)}")
+                return
+
+            try:
+                row = db.session.get(model, row_id)
+                # The row may have been deleted or given a newer image meanwhile
+                if row is None or getattr(row, url_column) != url:
+                    return
+                setattr(row, variants_column, variants)
+                db.session.commit()
+                invalidate_cache(cache_tag)
+            except Exception as e:
+                db.session.rollback()
+                print(f"❌ Image Pipeline Error ({url}): {str(e)}")
+
+
+def init_app(app):
+    """Attach the image pipeline to `app`"""
+    if Image is None:
+        print("⚠️ Pillow is not installed; uploaded images are served without variants")
+    app.extensions['image_pipeline'] = ImagePipeline(app, app.config['IMAGE_WORKERS'], app.config['IMAGE_QUALITY'])
+
+def get_image_pipeline():
+    return current_app.extensions['image_pipeline']
@@ -0,0 +1,50 @@
+from datetime import datetime, date
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes with orjson when it is installed and falls back
+    to the stdlib otherwise. Datetimes and dates are emitted as ISO 8601 and
+    Decimals as numbers on both paths, so models can return them unconverted.
+    """
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (datetime, date)):
+            return o.isoformat()
+        if isinstance(o, Decimal):
+            return float(o)
+        return DefaultJSONProvider.default(o)
+
+    def _orjson_dumps(self, obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._orjson_dumps(obj, indent), mimetype=self.mimetype)
@@ -0,0 +1,97 @@
+"""Initial schema: users, bookings, cars, content_blocks, stored_files and daily_stats"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# The tables as they stood when migrations were introduced, frozen here so this
+# revision doesn't change when the models do. Later changes need a revision of
+# their own; create_all only creates what is missing and never alters a table.
+metadata = sa.MetaData()
+
+JSONType = sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+sa.Table(
+    'users', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('name', sa.String(100), nullable=False),
+    sa.Column('email', sa.String(120), unique=True, nullable=False, index=True),
+    sa.Column('password', sa.String(255), nullable=False),
+    sa.Column('status', sa.String(20), server_default='user'),
+    sa.Column('is_verified', sa.Boolean),
+    sa.Column('verification_code', sa.String(6)),
+    sa.Column('code_expires_at', sa.DateTime),
+    sa.Column('created_at', sa.DateTime),
+    sa.Column('last_login', sa.DateTime),
+    sa.Column('token_version', sa.Integer, nullable=False, server_default='0'),
+    sa.Index('ix_users_created_at_id', 'created_at', 'id'),
+)
+
+sa.Table(
+    'bookings', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('user_id', sa.Integer, sa.ForeignKey('users.id'), nullable=False),
+    sa.Column('pickup_location', sa.String(200), nullable=False),
+    sa.Column('dropoff_location', sa.String(200), nullable=False),
+    sa.Column('car_type', sa.String(50), nullable=False),
+    sa.Column('status', sa.String(20), server_default='pending'),
+    sa.Column('ride_date', sa.DateTime),
+    sa.Column('price', sa.Numeric(10, 2)),
+    sa.Column('created_at', sa.DateTime),
+    sa.Column('updated_at', sa.DateTime),
+    sa.Index('ix_bookings_created_at_id', 'created_at', 'id'),
+    sa.Index('ix_bookings_status_created_at_id', 'status', 'created_at', 'id'),
+    sa.Index('ix_bookings_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+)
+
+sa.Table(
+    'cars', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('name', sa.String(100), nullable=False),
+    sa.Column('brand', sa.String(100)),
+    sa.Column('details', sa.Text),
+    sa.Column('image_url', sa.String(500)),
+    sa.Column('image_variants', JSONType),
+    sa.Column('is_active', sa.Boolean),
+    sa.Column('year', sa.String(10)),
+    sa.Column('seats', sa.String(10)),
+    sa.Column('transmission', sa.String(50)),
+    sa.Column('fuel', sa.String(50)),
+    sa.Column('features', JSONType),
+    sa.Column('specs', JSONType),
+    sa.Column('created_at', sa.DateTime),
+    sa.Column('updated_at', sa.DateTime),
+    sa.Index('ix_cars_created_at_id', 'created_at', 'id'),
+    sa.Index('ix_cars_is_active_created_at_id', 'is_active', 'created_at', 'id'),
+    sa.Index('ix_cars_specs_gin', 'specs', postgresql_using='gin'),
+)
+
+sa.Table(
+    'content_blocks', metadata,
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('key', sa.String(100), unique=True, nullable=False, index=True),
+    sa.Column('title', sa.String(200)),
+    sa.Column('content', sa.Text),
+    sa.Column('media_url', sa.String(500)),
+    sa.Column('media_variants', JSONType),
+    sa.Column('updated_by', sa.Integer, sa.ForeignKey('users.id')),
+    sa.Column('created_at', sa.DateTime),
+    sa.Column('updated_at', sa.DateTime),
+)
+
+sa.Table(
+    'stored_files', metadata,
+    sa.Column('url', sa.String(500), primary_key=True),
+    sa.Column('refcount', sa.Integer, nullable=False, server_default='0'),
+)
+
+sa.Table(
+    'daily_stats', metadata,
+    sa.Column('day', sa.Date, primary_key=True),
+    *[sa.Column(field, sa.Integer, nullable=False, server_default='0')
+      for field in ('bookings', 'pending', 'confirmed', 'completed', 'cancelled')],
+    sa.Column('revenue', sa.Numeric(12, 2), nullable=False, server_default='0'),
+    sa.Column('users', sa.Integer, nullable=False, server_default='0'),
+)
+
+
+def upgrade(op):
+    op.create_tables(metadata)
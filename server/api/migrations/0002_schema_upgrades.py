@@ -0,0 +1,59 @@
+"""Columns added to existing tables before versioned migrations"""
+import json
+
+import sqlalchemy as sa
+
+
+def _json_text(value, fallback):
+    """`value` if it is empty or valid JSON, else fallback(value) as JSON text"""
+    if value is None or not value.strip():
+        return value
+    try:
+        json.loads(value)
+        return value
+    except ValueError:
+        return fallback(value)
+
+def _split_features(value):
+    return json.dumps([feature.strip() for feature in value.split(',') if feature.strip()])
+
+
+def _clean_free_text_json(op):
+    """
+    Before features/specs became JSON they were free-form text, so a row may
+    not parse. Fix those one at a time (features split on commas, specs
+    dropped) so the type change below can't abort on them.
+    """
+    with op.engine.begin() as connection:
+        rows = connection.execute(sa.text('SELECT id, features, specs FROM cars')).all()
+        for car_id, features, specs in rows:
+            new_features = _json_text(features, _split_features)
+            new_specs = _json_text(specs, lambda value: None)
+            if (new_features, new_specs) == (features, specs):
+                continue
+            connection.execute(sa.text('UPDATE cars SET features = :features, specs = :specs WHERE id = :id'),
+                               {'features': new_features, 'specs': new_specs, 'id': car_id})
+            if new_features != features:
+                print(f"⚠️ cars {car_id}: features was not JSON, stored as {new_features} (was {features!r})")
+            if new_specs != specs:
+                print(f"⚠️ cars {car_id}: specs was not JSON, cleared (was {specs!r})")
+
+
+def upgrade(op):
+    if op.dialect != 'postgresql':
+        return
+    features_type = op.scalar("SELECT data_type FROM information_schema.columns "
+                              "WHERE table_name = 'cars' AND column_name = 'features'")
+    if features_type == 'text':
+        _clean_free_text_json(op)
+        op.execute("""
+            ALTER TABLE cars
+                ALTER COLUMN features TYPE JSONB USING NULLIF(btrim(features), '')::jsonb,
+                ALTER COLUMN specs TYPE JSONB USING NULLIF(btrim(specs), '')::jsonb
+        """)
+    op.execute(
+        "ALTER TABLE bookings ADD COLUMN IF NOT EXISTS price NUMERIC(10, 2)",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE cars ADD COLUMN IF NOT EXISTS image_variants JSONB",
+        "ALTER TABLE content_blocks ADD COLUMN IF NOT EXISTS media_variants JSONB",
+    )
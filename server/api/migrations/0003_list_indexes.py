@@ -0,0 +1,12 @@
+"""Composite indexes for keyset pagination and the filtered list endpoints"""
+
+
+def upgrade(op):
+    op.create_index('ix_users_created_at_id', 'users', 'created_at, id')
+    op.create_index('ix_bookings_created_at_id', 'bookings', 'created_at, id')
+    op.create_index('ix_bookings_status_created_at_id', 'bookings', 'status, created_at, id')
+    op.create_index('ix_bookings_user_id_created_at_id', 'bookings', 'user_id, created_at, id')
+    op.drop_index('ix_bookings_user_id')  # superseded by the composite above
+    op.create_index('ix_cars_created_at_id', 'cars', 'created_at, id')
+    op.create_index('ix_cars_is_active_created_at_id', 'cars', 'is_active, created_at, id')
+    op.create_index('ix_cars_specs_gin', 'cars', 'specs', using='gin')
@@ -0,0 +1,57 @@
+"""tsvector and trigram search columns and indexes (api/search.py)"""
+
+# table -> (column, weight) making up its search_vector
+SEARCH_FIELDS = {
+    'cars': [('name', 'A'), ('brand', 'A'), ('details', 'C')],
+    'bookings': [('pickup_location', 'A'), ('dropoff_location', 'A'), ('car_type', 'B')],
+}
+
+
+def _add_search_vector(op, table, fields):
+    """
+    A plain column kept current by a trigger and filled by a batched backfill,
+    instead of a generated column, whose ADD COLUMN rewrites the whole table
+    under an exclusive lock.
+    """
+    generated = op.scalar(
+        "SELECT is_generated FROM information_schema.columns "
+        "WHERE table_name = :table AND column_name = 'search_vector'", table=table)
+    if generated == 'ALWAYS':
+        return  # added as a generated column before migrations existed
+
+    columns = [column for column, _ in fields]
+    vector = ' || '.join(f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+                         for column, weight in fields)
+    op.execute(
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        f"""
+        CREATE OR REPLACE FUNCTION {table}_search_vector({', '.join(f'{c} text' for c in columns)})
+        RETURNS tsvector LANGUAGE sql IMMUTABLE AS $$ SELECT {vector} $$
+        """,
+        f"""
+        CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := {table}_search_vector({', '.join(f'NEW.{c}' for c in columns)});
+            RETURN NEW;
+        END $$
+        """,
+        f"DROP TRIGGER IF EXISTS {table}_search_vector ON {table}",
+        f"""
+        CREATE TRIGGER {table}_search_vector BEFORE INSERT OR UPDATE OF {', '.join(columns)}
+        ON {table} FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        """,
+    )
+    op.backfill(table, f"search_vector = {table}_search_vector({', '.join(columns)})",
+                where='search_vector IS NULL')
+
+
+def upgrade(op):
+    if op.dialect != 'postgresql':
+        return  # search uses the in-memory index instead
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, fields in SEARCH_FIELDS.items():
+        _add_search_vector(op, table, fields)
+    op.create_index('ix_cars_search_vector', 'cars', 'search_vector', using='gin')
+    op.create_index('ix_cars_name_trgm', 'cars', 'name gin_trgm_ops', using='gin')
+    op.create_index('ix_bookings_search_vector', 'bookings', 'search_vector', using='gin')
+    op.create_index('ix_users_email_trgm', 'users', 'email gin_trgm_ops', using='gin')
@@ -0,0 +1,207 @@
+"""
+Versioned schema migrations.
+
+Every NNNN_<slug>.py module in this package is one revision: the first line
+of its docstring describes it and `upgrade(op)` applies it. `flask db-upgrade`
+(or init_db()) runs the pending revisions in order and records each in the
+schema_migrations table. At startup the app only compares that version with
+the newest revision here (check_schema_version()); it never reflects tables.
+
+Revisions run against a live database, so they are made of idempotent steps
+that each commit on their own. On Postgres, indexes are built CONCURRENTLY and
+backfills commit in batches, so writes are not blocked for long. If a revision
+fails part-way, the next upgrade re-runs it from the start. Upgrades use
+session-level settings and locks, so point them at Postgres directly rather
+than through a transaction-mode pooler.
+"""
+import importlib
+import os
+import pkgutil
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from ..extensions import db
+
+
+MIGRATIONS_DIR = os.path.dirname(__file__)
+VERSION_TABLE = 'schema_migrations'
+UPGRADE_LOCK_ID = 7340025  # pg_advisory_lock key serializing concurrent upgrades
+LOCK_TIMEOUT = '5s'  # DDL gives up rather than queueing every query behind its lock
+
+version_table = sa.Table(
+    VERSION_TABLE, sa.MetaData(),
+    sa.Column('version', sa.Integer, primary_key=True),
+    sa.Column('description', sa.String(200), nullable=False),
+    sa.Column('applied_at', sa.DateTime, nullable=False),
+)
+
+
+class Operations:
+    """What a revision's upgrade(op) works with. Every call commits on its own."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.dialect = engine.dialect.name
+
+    def execute(self, *statements):
+        """Run `statements` in one transaction"""
+        with self.engine.begin() as connection:
+            if self.dialect == 'postgresql':
+                connection.exec_driver_sql(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+            for statement in statements:
+                connection.exec_driver_sql(statement)
+
+    def scalar(self, statement, **params):
+        """First column of the first row of a query (`:name` placeholders)"""
+        with self.engine.connect() as connection:
+            return connection.execute(sa.text(statement), params).scalar()
+
+    def create_tables(self, metadata):
+        """Create the tables in `metadata` that don't exist yet, with their indexes"""
+        metadata.create_all(self.engine)
+
+    @contextmanager
+    def _autocommit(self):
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            # Index builds can outlast DB_STATEMENT_TIMEOUT
+            connection.exec_driver_sql('SET statement_timeout = 0')
+            try:
+                yield connection
+            finally:
+                connection.exec_driver_sql('RESET statement_timeout')
+
+    def create_index(self, name, table, columns, using=None, where=None):
+        """
+        CREATE INDEX CONCURRENTLY on Postgres, so writes carry on meanwhile; an
+        invalid index left by an interrupted build is dropped and rebuilt.
+        Indexes with a `using` method (e.g. 'gin') are only built on Postgres.
+        `where` makes a partial index.
+        """
+        predicate = f' WHERE {where}' if where else ''
+        if self.dialect != 'postgresql':
+            if using is None:
+                self.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns}){predicate}')
+            return
+        method = f' USING {using}' if using else ''
+        with self._autocommit() as connection:
+            valid = connection.execute(sa.text(
+                'SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+                'WHERE c.relname = :name'), {'name': name}).scalar()
+            if valid is False:
+                connection.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+            connection.exec_driver_sql(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}{method} ({columns}){predicate}')
+
+    def drop_index(self, name):
+        if self.dialect != 'postgresql':
+            self.execute(f'DROP INDEX IF EXISTS {name}')
+            return
+        with self._autocommit() as connection:
+            connection.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+    def backfill(self, table, assignments, where=None, batch_size=10000):
+        """
+        UPDATE `table` SET `assignments` over id ranges of `batch_size`, one
+        transaction per range, so row locks are short-lived and replicas keep
+        up. Returns the number of rows updated.
+        """
+        with self.engine.connect() as connection:
+            low, high = connection.execute(sa.text(f'SELECT min(id), max(id) FROM {table}')).one()
+        if low is None:
+            return 0
+        condition = f' AND ({where})' if where else ''
+        statement = sa.text(f'UPDATE {table} SET {assignments} WHERE id >= :start AND id < :stop{condition}')
+        updated = 0
+        for start in range(low, high + 1, batch_size):
+            with self.engine.begin() as connection:
+                updated += connection.execute(statement, {'start': start, 'stop': start + batch_size}).rowcount
+        return updated
+
+
+def available_revisions():
+    """{version: module name} for every revision in this package, oldest first"""
+    revisions = {}
+    for module in pkgutil.iter_modules([MIGRATIONS_DIR]):
+        match = re.fullmatch(r'(\d{4})_\w+', module.name)
+        if match:
+            revisions[int(match.group(1))] = module.name
+    return dict(sorted(revisions.items()))
+
+def latest_version():
+    return max(available_revisions(), default=0)
+
+def current_version(connection):
+    """Newest applied revision; 0 for a database that has never been migrated"""
+    if not sa.inspect(connection).has_table(VERSION_TABLE):
+        return 0
+    return connection.execute(sa.select(sa.func.max(version_table.c.version))).scalar() or 0
+
+def describe(module):
+    return (module.__doc__ or module.__name__).strip().splitlines()[0]
+
+
+@contextmanager
+def _upgrade_lock(engine):
+    """Hold a Postgres advisory lock so two deploys can't upgrade at once"""
+    if engine.dialect.name != 'postgresql':
+        yield
+        return
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(sa.text('SELECT pg_advisory_lock(:id)'), {'id': UPGRADE_LOCK_ID})
+        try:
+            yield
+        finally:
+            connection.execute(sa.text('SELECT pg_advisory_unlock(:id)'), {'id': UPGRADE_LOCK_ID})
+
+
+def upgrade(target=None):
+    """
+    Apply pending revisions up to `target` (default: the newest).
+    Returns [(version, description, seconds)] for each one applied.
+    Needs an app context.
+    """
+    engine = db.engine
+    revisions = available_revisions()
+    target = latest_version() if target is None else target
+    op = Operations(engine)
+    applied = []
+    with _upgrade_lock(engine):
+        with engine.begin() as connection:
+            version_table.create(connection, checkfirst=True)
+            current = current_version(connection)
+        for version, name in revisions.items():
+            if version <= current or version > target:
+                continue
+            module = importlib.import_module(f'{__name__}.{name}')
+            started = time.perf_counter()
+            module.upgrade(op)
+            with engine.begin() as connection:
+                connection.execute(version_table.insert().values(
+                    version=version, description=describe(module), applied_at=datetime.utcnow()))
+            applied.append((version, describe(module), time.perf_counter() - started))
+    return applied
+
+def init_db():
+    """Create or upgrade the schema to the newest revision. Needs an app context."""
+    return upgrade()
+
+
+def check_schema_version():
+    """
+    Compare the database's schema version with the newest revision. Raises
+    RuntimeError while revisions are pending; a newer database (code rolled
+    back) only warns. Returns the database's version.
+    """
+    with db.engine.connect() as connection:
+        current = current_version(connection)
+    latest = latest_version()
+    if current < latest:
+        raise RuntimeError(f'Database schema is at version {current}, this code needs {latest}: '
+                           f'run `flask db-upgrade`')
+    if current > latest:
+        print(f"⚠️ Database schema version {current} is newer than this code ({latest})")
+    return current
@@ -0,0 +1,197 @@
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from .extensions import db
+
+BOOKING_STATUSES = ['pending', 'confirmed', 'completed', 'cancelled']
+# Literal, so queries repeating it can use the partial index on it (a bound IN list can't)
+STAFF_ROLES = "status IN ('admin', 'moderator')"
+
+# JSONB on Postgres (indexable with GIN), plain JSON elsewhere
+JSONType = db.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+class User(db.Model):
+    __tablename__ = 'users'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
+    password = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(20), default='user', server_default='user')
+    is_verified = db.Column(db.Boolean, default=False)
+    verification_code = db.Column(db.String(6), nullable=True)
+    code_expires_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_login = db.Column(db.DateTime, nullable=True)
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # bumped to revoke issued tokens
+
+    # Relationships
+    bookings = db.relationship('Booking', backref='user', lazy=True, cascade='all, delete-orphan')
+
+    __table_args__ = (
+        db.Index('ix_users_created_at_id', 'created_at', 'id'),
+        # Admin and moderator counts without reading every user
+        db.Index('ix_users_staff_status', 'status',
+                 postgresql_where=db.text(STAFF_ROLES), sqlite_where=db.text(STAFF_ROLES)),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'status': self.status,
+            'role': self.status,  # Alias for frontend compatibility
+            'is_verified': self.is_verified,
+            'created_at': self.created_at,
+            'last_login': self.last_login
+        }
+
+
+class Booking(db.Model):
+    __tablename__ = 'bookings'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    pickup_location = db.Column(db.String(200), nullable=False)
+    dropoff_location = db.Column(db.String(200), nullable=False)
+    car_type = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), default='pending', server_default='pending')  # pending, confirmed, completed, cancelled
+    ride_date = db.Column(db.DateTime, nullable=True)
+    price = db.Column(db.Numeric(10, 2), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_bookings_created_at_id', 'created_at', 'id'),
+        db.Index('ix_bookings_status_created_at_id', 'status', 'created_at', 'id'),
+        # my-bookings (user_id, newest first); also serves user_id lookups on its own
+        db.Index('ix_bookings_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'user_name': self.user.name if self.user else None,
+            'user_email': self.user.email if self.user else None,
+            'pickup_location': self.pickup_location,
+            'dropoff_location': self.dropoff_location,
+            'car_type': self.car_type,
+            'status': self.status,
+            'ride_date': self.ride_date,
+            'price': self.price,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+
+class Car(db.Model):
+    __tablename__ = 'cars'
+    
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    brand = db.Column(db.String(100), nullable=True)
+    details = db.Column(db.Text, nullable=True)
+    image_url = db.Column(db.String(500), nullable=True)
+    image_variants = db.Column(JSONType, nullable=True)  # variant -> {url, webp, width, height}
+    is_active = db.Column(db.Boolean, default=True)
+    year = db.Column(db.String(10), nullable=True)
+    seats = db.Column(db.String(10), nullable=True)
+    transmission = db.Column(db.String(50), nullable=True)
+    fuel = db.Column(db.String(50), nullable=True)
+    features = db.Column(JSONType, nullable=True)  # list of strings
+    specs = db.Column(JSONType, nullable=True)     # dict of spec name -> value
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_cars_created_at_id', 'created_at', 'id'),
+        db.Index('ix_cars_is_active_created_at_id', 'is_active', 'created_at', 'id'),
+        db.Index('ix_cars_specs_gin', 'specs', postgresql_using='gin'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'brand': self.brand,
+            'details': self.details,
+            'image_url': self.image_url,
+            'image_variants': self.image_variants or {},
+            'is_active': self.is_active,
+            'year': self.year,
+            'seats': self.seats,
+            'transmission': self.transmission,
+            'fuel': self.fuel,
+            'features': self.features or [],
+            'specs': self.specs or {},
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+class ContentBlock(db.Model):
+    __tablename__ = 'content_blocks'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(100), unique=True, nullable=False, index=True)  # e.g., 'hero_title', 'about_text'
+    title = db.Column(db.String(200), nullable=True)
+    content = db.Column(db.Text, nullable=True)  # HTML or plain text content
+    media_url = db.Column(db.String(500), nullable=True)  # Image/video URL
+    media_variants = db.Column(JSONType, nullable=True)  # variant -> {url, webp, width, height}
+    updated_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    updater = db.relationship('User', foreign_keys=[updated_by], lazy=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'key': self.key,
+            'title': self.title,
+            'content': self.content,
+            'media_url': self.media_url,
+            'media_variants': self.media_variants or {},
+            'updated_by': self.updated_by,
+            'updated_by_name': self.updater.name if self.updater else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+class StoredFile(db.Model):
+    """A content-addressed upload and how many rows reference it"""
+    __tablename__ = 'stored_files'
+
+    url = db.Column(db.String(500), primary_key=True)
+    refcount = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+class DailyStat(db.Model):
+    """Per-day rollup of bookings (by creation day), completed revenue, signups and verified signups"""
+    __tablename__ = 'daily_stats'
+
+    day = db.Column(db.Date, primary_key=True)
+    bookings = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    pending = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    confirmed = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    completed = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    cancelled = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    revenue = db.Column(db.Numeric(12, 2), nullable=False, default=0, server_default='0')
+    users = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    verified = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    def to_dict(self):
+        return {
+            'day': self.day,
+            'bookings': self.bookings,
+            'pending': self.pending,
+            'confirmed': self.confirmed,
+            'completed': self.completed,
+            'cancelled': self.cancelled,
+            'revenue': self.revenue,
+            'users': self.users,
+            'verified': self.verified
+        }
+
@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import datetime
+
+from flask import request
+from sqlalchemy import tuple_
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def encode_cursor(row):
+    """Opaque cursor pointing just past `row` in (created_at, id) order"""
+    raw = json.dumps([row.created_at.isoformat(), row.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+def get_page_args(default_limit=DEFAULT_PAGE_SIZE):
+    """
+    Read `limit` and `cursor` from the query string.
+    Returns (limit, cursor) where limit is None when unpaginated and no
+    default applies. Raises ValueError on bad input.
+    """
+    limit = request.args.get('limit', default_limit)
+    cursor = request.args.get('cursor')
+    if limit is None and cursor:
+        limit = DEFAULT_PAGE_SIZE
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError('Invalid limit')
+        if limit < 1:
+            raise ValueError('Invalid limit')
+        limit = min(limit, MAX_PAGE_SIZE)
+    return limit, decode_cursor(cursor) if cursor else None
+
+def paginate_keyset(query, model, limit, cursor):
+    """
+    Newest-first keyset pagination on (created_at, id).
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if limit is None:
+        return query.all(), None
+    if cursor:
+        query = query.filter(tuple_(model.created_at, model.id) < cursor)
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
@@ -0,0 +1,122 @@
+"""
+Password hashing.
+
+PASSWORD_HASH_METHOD selects the algorithm and cost for new hashes:
+werkzeug's `scrypt:N:r:p` or `pbkdf2:sha256:iterations`, or
+`argon2:time_cost:memory_kib:parallelism` when argon2-cffi is installed.
+Stored hashes of any of these formats still verify, and login replaces a
+hash whose method no longer matches the configured one.
+
+Hashing runs on a small thread pool in each process (hashlib and argon2
+release the GIL), so a burst of logins occupies PASSWORD_HASH_WORKERS cores
+per gunicorn worker instead of every request thread. Across the server that
+is workers x PASSWORD_HASH_WORKERS cores; the defaults divide the CPUs
+between the workers (config.py).
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+try:
+    import argon2
+except ImportError:
+    argon2 = None
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot frees up within PASSWORD_HASH_TIMEOUT"""
+
+
+def _normalize_method(method):
+    """Spell out the default parameters, matching the prefix stored in the hash"""
+    name, *params = method.split(':')
+    if name == 'scrypt':
+        defaults = ['32768', '8', '1']
+    elif name == 'pbkdf2':
+        defaults = ['sha256', str(DEFAULT_PBKDF2_ITERATIONS)]
+    elif name == 'argon2':
+        defaults = ['3', '65536', '4']
+    else:
+        raise ValueError(f'Unsupported password hash method: {method}')
+    return ':'.join([name, *params, *defaults[len(params):]])
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded thread pool"""
+
+    def __init__(self, method, workers, max_pending, timeout):
+        self.method = _normalize_method(method)
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+        self._argon2 = None
+        if self.method.startswith('argon2:'):
+            if argon2 is None:
+                raise RuntimeError('PASSWORD_HASH_METHOD is argon2 but the argon2-cffi package is not installed')
+            time_cost, memory_cost, parallelism = map(int, self.method.split(':')[1:])
+            self._argon2 = argon2.PasswordHasher(
+                time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+            )
+
+    def _get_executor(self):
+        # Created on first use in each process, so forked workers get their own threads
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='password-hash')
+                self._pid = os.getpid()
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PasswordHasherBusy()
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def _hash(self, password):
+        if self._argon2 is not None:
+            return self._argon2.hash(password)
+        return generate_password_hash(password, method=self.method)
+
+    def _verify(self, stored, password):
+        if stored.startswith('$argon2'):
+            if argon2 is None:
+                raise RuntimeError('argon2 password hash found but the argon2-cffi package is not installed')
+            try:
+                return argon2.PasswordHasher().verify(stored, password)
+            except argon2.exceptions.VerificationError:
+                return False
+        return check_password_hash(stored, password)
+
+    def hash(self, password):
+        return self._run(self._hash, password)
+
+    def verify(self, stored, password):
+        return self._run(self._verify, stored, password)
+
+    def needs_rehash(self, stored):
+        """True if `stored` was made with a different method or cost than the configured one"""
+        if self._argon2 is not None:
+            return not stored.startswith('$argon2') or self._argon2.check_needs_rehash(stored)
+        return stored.split('$', 1)[0] != self.method
+
+
+def init_app(app):
+    """Attach the password hasher configured by PASSWORD_HASH_* to `app`"""
+    app.extensions['password_hasher'] = PasswordHasher(
+        app.config['PASSWORD_HASH_METHOD'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        timeout=app.config['PASSWORD_HASH_TIMEOUT'],
+    )
+
+def get_password_hasher():
+    return current_app.extensions['password_hasher']
@@ -0,0 +1,181 @@
+"""
+Sliding-window rate limiting for the unauthenticated auth endpoints.
+
+Each limit is "count/seconds" and is enforced per client IP and per
+submitted email. Counts use the sliding-window counter approximation: the
+current fixed window's hits plus the previous window's hits weighted by
+how much of it still overlaps the sliding window. That is two integers per
+key, in process memory or in Redis (RATE_LIMIT_URL) when several workers
+must share them. In memory each gunicorn worker counts on its own, so a
+client can make up to the limit times WEB_CONCURRENCY attempts. Every
+attempt counts, including rejected ones, so a client that keeps hammering
+stays blocked.
+
+The client IP is request.remote_addr. Behind a reverse proxy, set
+TRUSTED_PROXIES so it is read from X-Forwarded-For rather than being the
+proxy's own address for everyone.
+"""
+import math
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+from flask import current_app, jsonify, request
+
+
+def parse_limit(limit):
+    """'5/60' -> (5, 60)"""
+    count, seconds = limit.split('/')
+    return int(count), int(seconds)
+
+
+class MemoryRateLimitStore:
+    """Per-process counters, swept of stale keys once max_keys is reached"""
+
+    def __init__(self, max_keys):
+        self.max_keys = max_keys
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key, window, now):
+        """Record one hit and return (previous window count, current window count)"""
+        start = int(now // window) * window
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None:
+                if len(self._windows) >= self.max_keys:
+                    self._sweep(now)
+                entry = self._windows[key] = [start, 0, 0, window]
+            elif entry[0] != start:
+                # Roll forward; a gap of more than one window empties the previous count
+                entry[2] = entry[1] if start - entry[0] == window else 0
+                entry[0], entry[1] = start, 0
+            entry[1] += 1
+            return entry[2], entry[1]
+
+    def _sweep(self, now):
+        for key in [key for key, (start, _, _, window) in self._windows.items() if start + 2 * window <= now]:
+            del self._windows[key]
+        while len(self._windows) >= self.max_keys:
+            del self._windows[next(iter(self._windows))]
+
+    def counters(self, now):
+        with self._lock:
+            return {
+                key: _estimate(previous, current, window, now - start)
+                for key, (start, current, previous, window) in self._windows.items()
+                if start + 2 * window > now
+            }
+
+
+class RedisRateLimitStore:
+    """Counters shared by all workers through Redis"""
+
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('RATE_LIMIT_URL is set but the redis package is not installed')
+        self._client = redis.Redis.from_url(url)
+
+    def hit(self, key, window, now):
+        start = int(now // window) * window
+        pipeline = self._client.pipeline(transaction=False)
+        pipeline.get(f'ratelimit:{key}:{start - window}')
+        pipeline.incr(f'ratelimit:{key}:{start}')
+        pipeline.expire(f'ratelimit:{key}:{start}', 2 * window)
+        previous, current, _ = pipeline.execute()
+        return int(previous or 0), current
+
+    def counters(self, now):
+        """Hits per key over its live windows (a scan, so meant for monitoring only)"""
+        counters = Counter()
+        for name in self._client.scan_iter(match='ratelimit:*', count=1000):
+            key = name.decode()[len('ratelimit:'):].rsplit(':', 1)[0]
+            counters[key] += int(self._client.get(name) or 0)
+        return dict(counters)
+
+
+def _estimate(previous, current, window, elapsed):
+    return previous * (window - elapsed) / window + current
+
+
+class RateLimiter:
+    """Checks hits against limits and tallies allowed/rejected requests per limit"""
+
+    def __init__(self, store):
+        self.store = store
+        self.allowed = Counter()
+        self.rejected = Counter()
+        self._lock = threading.Lock()
+
+    def check(self, key, limit):
+        """Record a hit on `key`. Returns 0 if allowed, else seconds until retrying may succeed."""
+        count, window = parse_limit(limit)
+        now = time.time()
+        previous, current = self.store.hit(key, window, now)
+        elapsed = now - int(now // window) * window
+        if _estimate(previous, current, window, elapsed) <= count:
+            return 0
+        return max(1, math.ceil(window - elapsed))
+
+    def record(self, name, allowed):
+        with self._lock:
+            (self.allowed if allowed else self.rejected)[name] += 1
+
+    def stats(self):
+        with self._lock:
+            allowed, rejected = dict(self.allowed), dict(self.rejected)
+        return {
+            'allowed': allowed,
+            'rejected': rejected,
+            'keys': self.store.counters(time.time()),
+        }
+
+
+def init_app(app):
+    """Attach the rate limiter, backed by Redis when RATE_LIMIT_URL is set"""
+    if app.config['RATE_LIMIT_URL']:
+        store = RedisRateLimitStore(app.config['RATE_LIMIT_URL'])
+    else:
+        store = MemoryRateLimitStore(app.config['RATE_LIMIT_MAX_KEYS'])
+    app.extensions['rate_limiter'] = RateLimiter(store)
+
+def get_rate_limiter():
+    return current_app.extensions['rate_limiter']
+
+def rate_limited(name):
+    """
+    Throttle a JSON endpoint by client IP and by the `email` field of its body,
+    using the RATE_LIMIT_<NAME>_IP and RATE_LIMIT_<NAME>_EMAIL limits. Runs
+    before the view, so rejected requests never reach the database.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            config = current_app.config
+            if not config['RATE_LIMIT_ENABLED']:
+                return f(*args, **kwargs)
+
+            limiter = get_rate_limiter()
+            checks = [(f'{name}:ip:{request.remote_addr}', config[f'RATE_LIMIT_{name.upper()}_IP'])]
+            data = request.get_json(silent=True)
+            email = data.get('email') if isinstance(data, dict) else None
+            if isinstance(email, str) and email.strip():
+                checks.append((f'{name}:email:{email.strip().lower()}', config[f'RATE_LIMIT_{name.upper()}_EMAIL']))
+
+            retry_after = max(limiter.check(key, limit) for key, limit in checks)
+            if retry_after:
+                limiter.record(name, allowed=False)
+                response = jsonify({
+                    'success': False,
+                    'message': f'Too many attempts. Please try again in {retry_after} seconds'
+                })
+                response.headers['Retry-After'] = str(retry_after)
+                return response, 429
+
+            limiter.record(name, allowed=True)
+            return f(*args, **kwargs)
+        return decorated
+    return decorator
@@ -0,0 +1,154 @@
+"""
+daily_stats rollup maintenance.
+
+daily_stats is kept in step with bookings/users by mapper events, inside the
+same transaction as the row change. `flask rebuild-daily-stats` backfills it
+and `flask check-daily-stats` compares it against a full recount.
+"""
+from datetime import date
+
+from sqlalchemy import func, case
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .extensions import db
+from .models import BOOKING_STATUSES, Booking, DailyStat, User
+
+
+DAILY_STAT_FIELDS = ['bookings', *BOOKING_STATUSES, 'revenue', 'users', 'verified']
+
+
+def _booking_contribution(status, price):
+    """What a single booking adds to its creation day"""
+    contribution = {'bookings': 1}
+    if status in BOOKING_STATUSES:
+        contribution[status] = 1
+    if status == 'completed' and price:
+        contribution['revenue'] = price
+    return contribution
+
+
+def apply_daily_delta(connection, day, delta):
+    """Atomically add `delta` to the rollup row for `day`, creating it if needed"""
+    delta = {field: value for field, value in delta.items() if value}
+    if not delta:
+        return
+
+    dialect = postgresql if connection.dialect.name == 'postgresql' else sqlite
+    table = DailyStat.__table__
+    stmt = dialect.insert(table).values(day=day, **delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.day],
+        set_={field: table.c[field] + stmt.excluded[field] for field in delta}
+    )
+    connection.execute(stmt)
+
+
+@db.event.listens_for(Booking, 'after_insert')
+def _rollup_booking_insert(mapper, connection, target):
+    apply_daily_delta(connection, target.created_at.date(),
+                      _booking_contribution(target.status, target.price))
+
+
+@db.event.listens_for(Booking, 'after_update')
+def _rollup_booking_update(mapper, connection, target):
+    state = db.inspect(target)
+    status_history = state.attrs.status.history
+    price_history = state.attrs.price.history
+    if not (status_history.deleted or price_history.deleted):
+        return
+
+    old_status = status_history.deleted[0] if status_history.deleted else target.status
+    old_price = price_history.deleted[0] if price_history.deleted else target.price
+    old = _booking_contribution(old_status, old_price)
+    new = _booking_contribution(target.status, target.price)
+    delta = {field: new.get(field, 0) - old.get(field, 0) for field in set(old) | set(new)}
+    apply_daily_delta(connection, target.created_at.date(), delta)
+
+
+@db.event.listens_for(Booking, 'after_delete')
+def _rollup_booking_delete(mapper, connection, target):
+    contribution = _booking_contribution(target.status, target.price)
+    apply_daily_delta(connection, target.created_at.date(),
+                      {field: -value for field, value in contribution.items()})
+
+
+@db.event.listens_for(User, 'after_insert')
+def _rollup_user_insert(mapper, connection, target):
+    apply_daily_delta(connection, target.created_at.date(), {'users': 1, 'verified': int(bool(target.is_verified))})
+
+
+@db.event.listens_for(User, 'after_update')
+def _rollup_user_update(mapper, connection, target):
+    history = db.inspect(target).attrs.is_verified.history
+    if not history.deleted:
+        return
+    delta = int(bool(target.is_verified)) - int(bool(history.deleted[0]))
+    apply_daily_delta(connection, target.created_at.date(), {'verified': delta})
+
+
+@db.event.listens_for(User, 'after_delete')
+def _rollup_user_delete(mapper, connection, target):
+    apply_daily_delta(connection, target.created_at.date(),
+                      {'users': -1, 'verified': -int(bool(target.is_verified))})
+
+
+def _day_key(value):
+    """Normalize a DATE() bucket (date on Postgres, 'YYYY-MM-DD' string on SQLite)"""
+    if isinstance(value, str):
+        return value[:10]
+    return value.strftime('%Y-%m-%d')
+
+
+def recount_daily_stats():
+    """Recompute the rollup from the base tables: {day: {field: value}}"""
+    booking_day = func.date(Booking.created_at)
+    booking_rows = db.session.query(
+        booking_day,
+        func.count(Booking.id),
+        *[func.count(Booking.id).filter(Booking.status == status) for status in BOOKING_STATUSES],
+        func.sum(case((Booking.status == 'completed', Booking.price), else_=0))
+    ).group_by(booking_day).all()
+
+    user_day = func.date(User.created_at)
+    user_rows = db.session.query(user_day, func.count(User.id), func.count(User.id).filter(User.is_verified.is_(True))) \
+        .group_by(user_day).all()
+
+    stats = {}
+    for day, total, *status_counts, revenue in booking_rows:
+        row = stats.setdefault(date.fromisoformat(_day_key(day)), dict.fromkeys(DAILY_STAT_FIELDS, 0))
+        row['bookings'] = total
+        row.update(zip(BOOKING_STATUSES, status_counts))
+        row['revenue'] = revenue or 0
+    for day, count, verified in user_rows:
+        row = stats.setdefault(date.fromisoformat(_day_key(day)), dict.fromkeys(DAILY_STAT_FIELDS, 0))
+        row['users'] = count
+        row['verified'] = verified
+    return stats
+
+
+def rebuild_daily_stats():
+    """Replace the rollup with a full recount. Returns the number of days written."""
+    stats = recount_daily_stats()
+    DailyStat.query.delete()
+    db.session.add_all(DailyStat(day=day, **row) for day, row in stats.items())
+    db.session.commit()
+    return len(stats)
+
+
+def check_daily_stats():
+    """Compare the rollup against a full recount, returning the mismatching days"""
+    expected = recount_daily_stats()
+    actual = {stat.day: {field: getattr(stat, field) for field in DAILY_STAT_FIELDS}
+              for stat in DailyStat.query.all()}
+    empty = dict.fromkeys(DAILY_STAT_FIELDS, 0)
+
+    mismatches = []
+    for day in sorted(set(expected) | set(actual)):
+        want = expected.get(day, empty)
+        have = actual.get(day, empty)
+        diff = {field: {'expected': float(want[field]), 'actual': float(have[field])}
+                for field in DAILY_STAT_FIELDS if float(want[field]) != float(have[field])}
+        if diff:
+            mismatches.append({'day': day.isoformat(), 'fields': diff})
+    return mismatches
+
@@ -0,0 +1,137 @@
+"""
+Read-replica routing.
+
+Views decorated with @read_replica(...) run their GET queries against one
+of the DB_REPLICA_URLS; everything else, and every flush, uses the primary.
+
+Reads stay on the primary for DB_REPLICA_STICKY_SECONDS after a write the
+replicas may not have caught up with: a user's own writes (keyed by user id)
+and, for views that name them, any write to the given tables.
+"""
+import random
+from functools import wraps
+
+import sqlalchemy as sa
+from flask import current_app, g, has_app_context, request
+from flask_sqlalchemy.session import Session
+
+from .cache import TTLCache
+from .database import build_engine_options
+
+
+class RoutingSession(Session):
+    """Session that sends the current request's reads to its chosen replica"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and not isinstance(clause, sa.UpdateBase) \
+                and has_app_context():
+            replica = g.get('db_replica')
+            if replica is not None:
+                return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@sa.event.listens_for(RoutingSession, 'after_flush')
+def _record_written_tables(session, flush_context):
+    tables = session.info.setdefault('written_tables', set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tables.add(sa.inspect(obj).mapper.local_table.name)
+
+@sa.event.listens_for(RoutingSession, 'after_commit')
+def _mark_primary_sticky(session):
+    tables = session.info.pop('written_tables', None)
+    if not tables or not has_app_context() or 'replica_sticky' not in current_app.extensions:
+        return
+    keys = [f'table:{table}' for table in tables]
+    current_user = g.get('current_user')
+    if current_user is not None:
+        keys.append(f'user:{current_user.id}')
+    current_app.extensions['replica_sticky'].mark(keys)
+
+@sa.event.listens_for(RoutingSession, 'after_rollback')
+def _forget_written_tables(session):
+    session.info.pop('written_tables', None)
+
+
+class MemoryStickyStore:
+    """Per-process record of recent writes"""
+
+    def __init__(self, ttl):
+        self._marks = TTLCache(maxsize=10000, ttl=ttl)
+
+    def mark(self, keys):
+        for key in keys:
+            self._marks.set(key, True)
+
+    def is_marked(self, keys):
+        return any(self._marks.get(key) for key in keys)
+
+
+class RedisStickyStore:
+    """Record of recent writes shared by all workers through Redis"""
+
+    def __init__(self, url, ttl):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('DB_REPLICA_STICKY_URL is set but the redis package is not installed')
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def mark(self, keys):
+        pipeline = self._client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.setex(f'sticky:{key}', self.ttl, 1)
+        pipeline.execute()
+
+    def is_marked(self, keys):
+        return any(self._client.mget([f'sticky:{key}' for key in keys]))
+
+
+def configure_replica_binds(app):
+    """Add one SQLALCHEMY_BINDS entry per replica URL. Call before db.init_app()."""
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    keys = []
+    for index, url in enumerate(app.config['DB_REPLICA_URLS']):
+        key = f'replica_{index}'
+        binds[key] = {'url': url, **build_engine_options(app.config, url)}
+        keys.append(key)
+    app.config['DB_REPLICA_KEYS'] = keys
+
+def init_app(app):
+    """
+    Attach the sticky-read store when replicas are configured. A write
+    handled by one worker must keep every worker's reads on the primary, so
+    with more than one worker the store has to be shared (DB_REPLICA_STICKY_URL).
+    """
+    if not app.config['DB_REPLICA_KEYS']:
+        return
+    ttl = app.config['DB_REPLICA_STICKY_SECONDS']
+    if app.config['DB_REPLICA_STICKY_URL']:
+        app.extensions['replica_sticky'] = RedisStickyStore(app.config['DB_REPLICA_STICKY_URL'], ttl)
+    elif app.config['WEB_CONCURRENCY'] > 1:
+        raise RuntimeError('DB_REPLICA_URLS with more than one worker needs DB_REPLICA_STICKY_URL (Redis), '
+                           'or WEB_CONCURRENCY=1: in-memory read-your-writes marks are per process')
+    else:
+        app.extensions['replica_sticky'] = MemoryStickyStore(ttl)
+
+def read_replica(*tables):
+    """
+    Serve a view's GET requests from a replica unless the current user, or a
+    write to one of `tables`, has made the replicas stale. Apply below
+    token_required so authentication always reads the primary.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            replicas = current_app.config['DB_REPLICA_KEYS']
+            if replicas and request.method in ('GET', 'HEAD'):
+                keys = [f'table:{table}' for table in tables]
+                current_user = g.get('current_user')
+                if current_user is not None:
+                    keys.append(f'user:{current_user.id}')
+                if not current_app.extensions['replica_sticky'].is_marked(keys):
+                    g.db_replica = random.choice(replicas)
+            return f(*args, **kwargs)
+        return decorated
+    return decorator
@@ -0,0 +1,310 @@
+"""
+Ranked search over cars and bookings.
+
+On Postgres, cars and bookings carry trigger-maintained `search_vector`
+tsvector columns with GIN indexes (migrations/0004_search.py). Every query
+term is matched as a prefix; car names also match by trigram similarity so
+misspellings still find them, and terms of three or more characters match
+anywhere in a booking's user email through a pg_trgm index on users.email.
+
+Elsewhere (SQLite in development) each process keeps an in-memory inverted
+index per table, loaded on first search and refreshed for rows this process
+commits. Other processes' writes are not seen, so run a single worker there.
+"""
+import heapq
+import re
+import threading
+from bisect import bisect_left
+
+import sqlalchemy as sa
+from flask import current_app, has_app_context, request
+from sqlalchemy import case, func, or_
+
+from .extensions import db
+from .models import Booking, Car, User
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .routing import RoutingSession
+
+
+MAX_TERMS = 8
+TRIGRAM_MIN_LENGTH = 3  # shorter patterns can't use a trigram index
+
+# Field weights, matching ts_rank's defaults for weights A, B and C
+WEIGHT_A, WEIGHT_B, WEIGHT_C = 1.0, 0.4, 0.2
+EMAIL_WEIGHT = WEIGHT_A
+
+SEARCHABLE = {Car: 'cars', Booking: 'bookings'}
+
+
+def search_terms(q):
+    """Lowercased, de-duplicated words of a search query"""
+    terms = []
+    for term in re.findall(r'[^\W_]+', q.lower()):
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+def get_search_args():
+    """
+    Read `q`, `limit` and `offset` from the query string.
+    Returns (terms, limit, offset). Raises ValueError on bad input.
+    """
+    q = request.args.get('q', '').strip()
+    if not q:
+        raise ValueError('Search query is required')
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        raise ValueError('Invalid limit or offset')
+    if limit < 1 or offset < 0:
+        raise ValueError('Invalid limit or offset')
+    return search_terms(q), min(limit, MAX_PAGE_SIZE), offset
+
+def _page(rows, offset, limit):
+    """Trim a limit + 1 fetch to (rows, next_offset)"""
+    if len(rows) > limit:
+        return rows[:limit], offset + limit
+    return rows, None
+
+def _prefix_query(terms, operator):
+    return func.to_tsquery('simple', f' {operator} '.join(f'{term}:*' for term in terms))
+
+
+def search_cars(terms, offset, limit, active_only=False):
+    """Cars matching every term, best first. Returns (cars, next_offset)."""
+    if not terms:
+        return [], None
+    if db.engine.dialect.name != 'postgresql':
+        cars, next_offset, _ = _search_index('cars', Car, terms, offset, limit, 'active' if active_only else None)
+        return cars, next_offset
+
+    vector = sa.literal_column('cars.search_vector')
+    tsquery = _prefix_query(terms, '&')
+    phrase = ' '.join(terms)
+    query = Car.query.filter(or_(vector.op('@@')(tsquery), Car.name.op('%')(phrase)))
+    if active_only:
+        query = query.filter(Car.is_active.is_(True))
+    rank = func.ts_rank(vector, tsquery) + func.similarity(Car.name, phrase)
+    rows = query.order_by(rank.desc(), Car.id.desc()).offset(offset).limit(limit + 1).all()
+    return _page(rows, offset, limit)
+
+def search_bookings(terms, offset, limit, status=None):
+    """
+    Bookings matching every term in their locations, car type or user email,
+    best first. Only the newest SEARCH_MAX_CANDIDATES matches are ranked.
+    Returns (bookings, next_offset, truncated), where `truncated` says older
+    matches were left out.
+    """
+    if not terms:
+        return [], None, False
+    if db.engine.dialect.name != 'postgresql':
+        return _search_index('bookings', Booking, terms, offset, limit,
+                             f'status:{status}' if status else None,
+                             current_app.config['SEARCH_MAX_CANDIDATES'])
+
+    vector = sa.literal_column('bookings.search_vector')
+    rank = func.ts_rank(vector, _prefix_query(terms, '|'))
+    conditions = []
+    for term in terms:
+        condition = vector.op('@@')(_prefix_query([term], '&'))
+        if len(term) >= TRIGRAM_MIN_LENGTH:
+            in_email = User.email.contains(term, autoescape=True)
+            condition = or_(condition, Booking.user_id.in_(sa.select(User.id).where(in_email)))
+            rank = rank + case((in_email, EMAIL_WEIGHT), else_=0)
+        conditions.append(condition)
+
+    candidates = sa.select(Booking.id, rank.label('rank')) \
+        .join(User, Booking.user_id == User.id).where(*conditions)
+    if status:
+        candidates = candidates.where(Booking.status == status)
+    # Newest first through ix_bookings_created_at_id, so the cap drops the oldest matches
+    max_candidates = current_app.config['SEARCH_MAX_CANDIDATES']
+    candidates = candidates.order_by(Booking.created_at.desc(), Booking.id.desc()) \
+        .limit(max_candidates).subquery()
+
+    results = Booking.query.options(sa.orm.joinedload(Booking.user)) \
+        .join(candidates, Booking.id == candidates.c.id) \
+        .add_columns(func.count().over()) \
+        .order_by(candidates.c.rank.desc(), Booking.id.desc()) \
+        .offset(offset).limit(limit + 1).all()
+    # The window count sees every candidate; reaching the cap means older matches may be missing
+    truncated = bool(results) and results[0][1] >= max_candidates
+    return (*_page([booking for booking, _ in results], offset, limit), truncated)
+
+
+# ----------------------------------------------------------------------------
+# In-memory fallback
+# ----------------------------------------------------------------------------
+
+def _load_cars(ids=None):
+    query = db.session.query(Car.id, Car.name, Car.brand, Car.details, Car.is_active)
+    if ids is not None:
+        query = query.filter(Car.id.in_(ids))
+    for row in query:
+        fields = [(row.name, WEIGHT_A), (row.brand, WEIGHT_A), (row.details, WEIGHT_C)]
+        yield row.id, fields, {'active'} if row.is_active else set()
+
+def _load_bookings(ids=None):
+    query = db.session.query(Booking.id, Booking.pickup_location, Booking.dropoff_location,
+                             Booking.car_type, Booking.status, User.email) \
+        .join(User, Booking.user_id == User.id)
+    if ids is not None:
+        query = query.filter(Booking.id.in_(ids))
+    for row in query.order_by(Booking.id):
+        fields = [(row.pickup_location, WEIGHT_A), (row.dropoff_location, WEIGHT_A),
+                  (row.car_type, WEIGHT_B), (row.email, EMAIL_WEIGHT)]
+        yield row.id, fields, {f'status:{row.status}'}
+
+
+class InvertedIndex:
+    """
+    Per-process term -> {doc id: weight} postings for one table.
+    `load(ids=None)` yields (id, [(text, weight)], tags) for the given rows,
+    or for all of them.
+    """
+
+    def __init__(self, load):
+        self._load = load
+        self._postings = {}
+        self._docs = {}  # id -> (terms, tags)
+        self._vocabulary = None  # sorted terms, rebuilt after changes
+        self._stale = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def mark_stale(self, ids):
+        with self._lock:
+            if self._loaded:  # otherwise the first load reads everything anyway
+                self._stale.update(ids)
+
+    def add(self, doc_id, fields, tags=()):
+        self.remove(doc_id)
+        weights = {}
+        for text, weight in fields:
+            for term in re.findall(r'[^\W_]+', (text or '').lower()):
+                weights[term] = weights.get(term, 0) + weight
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary = None
+            postings[doc_id] = weight
+        self._docs[doc_id] = (tuple(weights), frozenset(tags))
+
+    def remove(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for term in doc[0]:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+
+    def _refresh(self):
+        if not self._loaded:
+            for doc_id, fields, tags in self._load():
+                self.add(doc_id, fields, tags)
+            self._loaded = True
+            self._stale.clear()
+        elif self._stale:
+            ids, self._stale = self._stale, set()
+            found = set()
+            for doc_id, fields, tags in self._load(ids):
+                self.add(doc_id, fields, tags)
+                found.add(doc_id)
+            for doc_id in ids - found:
+                self.remove(doc_id)
+
+    def _expand(self, term):
+        """Postings of every indexed term starting with `term`"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, term)
+        expanded = []
+        while i < len(vocabulary) and vocabulary[i].startswith(term):
+            expanded.append(self._postings[vocabulary[i]])
+            i += 1
+        return expanded
+
+    def search(self, terms, offset, limit, tag=None, max_candidates=None):
+        """
+        Ids of docs matching every term, best first, for one page plus one,
+        and whether matches were left out. Like the Postgres query, only the
+        newest `max_candidates` matches are ranked.
+        """
+        with self._lock:
+            self._refresh()
+            # Walk the rarest term's postings and probe the others
+            expanded = sorted((self._expand(term) for term in terms),
+                              key=lambda postings: sum(map(len, postings)))
+            first, *others = [_merge(postings) for postings in expanded]
+            docs = self._docs
+            scores = {}
+            truncated = False
+            # Newest (highest id) first: re-added docs sit at the end of a posting list out of order
+            for doc_id in sorted(first, reverse=True):
+                if (tag is not None and tag not in docs[doc_id][1]) \
+                        or not all(doc_id in matched for matched in others):
+                    continue
+                if len(scores) == max_candidates:
+                    truncated = True
+                    break
+                scores[doc_id] = first[doc_id] + sum(matched[doc_id] for matched in others)
+        ranked = heapq.nsmallest(offset + limit + 1, scores.items(), key=lambda item: (-item[1], -item[0]))
+        return [doc_id for doc_id, _ in ranked[offset:]], truncated
+
+
+def _merge(postings):
+    if len(postings) == 1:
+        return postings[0]
+    merged = {}
+    for doc_weights in postings:
+        merged.update(doc_weights)
+    return merged
+
+
+def _search_index(name, model, terms, offset, limit, tag, max_candidates=None):
+    """(rows, next_offset, truncated) from the in-memory index"""
+    ids, truncated = current_app.extensions['search_indexes'][name].search(terms, offset, limit, tag,
+                                                                          max_candidates)
+    query = model.query
+    if model is Booking:
+        query = query.options(sa.orm.joinedload(Booking.user))
+    rows = {row.id: row for row in query.filter(model.id.in_(ids))}
+    return (*_page([rows[i] for i in ids if i in rows], offset, limit), truncated)
+
+
+@sa.event.listens_for(RoutingSession, 'after_flush')
+def _record_search_changes(session, flush_context):
+    changes = session.info.setdefault('search_changes', {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        name = SEARCHABLE.get(type(obj))
+        if name:
+            changes.setdefault(name, set()).add(obj.id)
+
+@sa.event.listens_for(RoutingSession, 'after_commit')
+def _refresh_search_indexes(session):
+    changes = session.info.pop('search_changes', None)
+    if not changes or not has_app_context():
+        return
+    indexes = current_app.extensions.get('search_indexes')
+    if indexes:
+        for name, ids in changes.items():
+            indexes[name].mark_stale(ids)
+
+@sa.event.listens_for(RoutingSession, 'after_rollback')
+def _forget_search_changes(session):
+    session.info.pop('search_changes', None)
+
+
+def init_app(app):
+    """Attach the in-memory fallback indexes (used when not on Postgres)"""
+    app.extensions['search_indexes'] = {'cars': InvertedIndex(_load_cars),
+                                        'bookings': InvertedIndex(_load_bookings)}
@@ -0,0 +1,143 @@
+import random
+import string
+from collections import namedtuple
+from datetime import datetime, timedelta
+from functools import wraps
+
+import jwt
+from flask import current_app, g, jsonify, request
+
+from .cache import TTLCache
+from .extensions import db
+from .models import User
+
+
+def generate_verification_code():
+    """Generate a 6-digit verification code"""
+    return ''.join(random.choices(string.digits, k=6))
+
+
+AuthState = namedtuple('AuthState', ['status', 'is_verified', 'token_version'])
+
+def init_app(app):
+    """Attach the per-process auth state cache to `app`"""
+    app.extensions['auth_cache'] = TTLCache(app.config['AUTH_CACHE_SIZE'], app.config['AUTH_CACHE_TTL'])
+
+def get_auth_state(user_id):
+    """(status, is_verified, token_version) for a user, from cache or a narrow SELECT"""
+    auth_cache = current_app.extensions['auth_cache']
+    state = auth_cache.get(user_id)
+    if state is None:
+        row = db.session.query(User.status, User.is_verified, User.token_version) \
+            .filter(User.id == user_id).first()
+        if row is None:
+            return None
+        state = AuthState(*row)
+        auth_cache.set(user_id, state)
+    return state
+
+def invalidate_auth_state(user_id):
+    """
+    Drop a cached auth state after a role, verification or password change.
+    Only this process's cache is cleared; other workers catch up within AUTH_CACHE_TTL.
+    """
+    current_app.extensions['auth_cache'].delete(user_id)
+
+
+class AuthenticatedUser:
+    """
+    The user behind a valid token. id, status and is_verified come from the
+    auth cache; any other attribute loads the full User row on first access.
+    """
+    __slots__ = ('id', 'status', 'is_verified', '_user')
+
+    def __init__(self, user_id, state):
+        object.__setattr__(self, 'id', user_id)
+        object.__setattr__(self, 'status', state.status)
+        object.__setattr__(self, 'is_verified', state.is_verified)
+        object.__setattr__(self, '_user', None)
+
+    @property
+    def user(self):
+        if self._user is None:
+            object.__setattr__(self, '_user', db.session.get(User, self.id))
+        return self._user
+
+    def __getattr__(self, name):
+        return getattr(self.user, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.user, name, value)
+
+
+def generate_token(user):
+    """Generate JWT token"""
+    payload = {
+        'user_id': user.id,
+        'status': user.status,
+        'ver': user.token_version or 0,
+        'exp': datetime.utcnow() + timedelta(days=7),
+        'iat': datetime.utcnow()
+    }
+    return jwt.encode(payload, current_app.config['SECRET_KEY'], algorithm='HS256')
+
+def token_required(f):
+    """Decorator to protect routes with JWT authentication"""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        current_user = g.get('current_user')
+        if current_user is not None:
+            return f(current_user, *args, **kwargs)
+
+        token = None
+        
+        if 'Authorization' in request.headers:
+            auth_header = request.headers['Authorization']
+            try:
+                token = auth_header.split(' ')[1]
+            except IndexError:
+                return jsonify({'success': False, 'message': 'Invalid token format'}), 401
+        
+        if not token:
+            return jsonify({'success': False, 'message': 'Token is missing'}), 401
+        
+        try:
+            payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
+            state = get_auth_state(payload['user_id'])
+            
+            if not state:
+                return jsonify({'success': False, 'message': 'User not found'}), 401
+            
+            if payload.get('ver', 0) != state.token_version:
+                return jsonify({'success': False, 'message': 'Token has been revoked'}), 401
+            
+            if not state.is_verified:
+                return jsonify({'success': False, 'message': 'Email not verified'}), 403
+                
+        except jwt.ExpiredSignatureError:
+            return jsonify({'success': False, 'message': 'Token has expired'}), 401
+        except jwt.InvalidTokenError:
+            return jsonify({'success': False, 'message': 'Invalid token'}), 401
+        except Exception:
+            return jsonify({'success': False, 'message': 'Authentication failed'}), 401
+        
+        current_user = g.current_user = AuthenticatedUser(payload['user_id'], state)
+        return f(current_user, *args, **kwargs)
+    
+    return decorated
+
+
+def role_required(allowed_roles):
+    """Decorator to require specific roles (admin/moderator)"""
+    def decorator(f):
+        @wraps(f)
+        @token_required
+        def decorated(current_user, *args, **kwargs):
+            if current_user.status not in allowed_roles:
+                return jsonify({
+                    'success': False,
+                    'message': f'Access denied. Required roles: {", ".join(allowed_roles)}'
+                }), 403
+            return f(current_user, *args, **kwargs)
+        return decorated
+    return decorator
@@ -0,0 +1,160 @@
+"""
+Content-addressed upload storage.
+
+Uploads are written to disk while being hashed and stored as
+uploads/<folder>/<hh>/<sha256><ext>, so identical files are kept once.
+stored_files counts the Car.image_url / ContentBlock.media_url references
+to each upload, maintained by mapper events in the same transaction as the
+row change. Nothing is deleted inline, since a file may be shared or the
+transaction may roll back; `flask gc-uploads` removes files whose count has
+dropped to zero, or that no row ever referenced, with their image variants.
+"""
+import hashlib
+import os
+import tempfile
+import time
+
+from flask import current_app
+from sqlalchemy.dialects import postgresql, sqlite
+from werkzeug.utils import secure_filename
+
+from .extensions import db
+from .images import variant_paths
+from .models import Car, ContentBlock, StoredFile
+from .utils import upload_path
+
+UPLOAD_ROOT = 'uploads'
+
+# NamedTemporaryFile creates files as 0600; stored uploads get the mode open() would
+# give them, so a front server reading UPLOAD_ROOT (UPLOAD_ACCEL_REDIRECT) can serve them
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+# model -> column holding an /uploads/... URL
+UPLOAD_FIELDS = {
+    Car: 'image_url',
+    ContentBlock: 'media_url',
+}
+
+
+class UploadWriter:
+    """
+    Writes an upload to a temp file next to its final location while hashing
+    it, then moves it to its content-addressed name. Identical content is
+    stored once.
+    """
+
+    def __init__(self, folder, filename):
+        _, ext = os.path.splitext(secure_filename(filename or ''))
+        self.folder = folder
+        self.ext = ext.lower()
+        self.size = 0
+        self._folder_path = os.path.join(current_app.config['UPLOAD_ROOT'], folder)
+        os.makedirs(self._folder_path, exist_ok=True)
+        self._digest = hashlib.sha256()
+        self._tmp = tempfile.NamedTemporaryFile(dir=self._folder_path, prefix='.upload-', delete=False)
+
+    def write(self, chunk):
+        self._digest.update(chunk)
+        self._tmp.write(chunk)
+        self.size += len(chunk)
+
+    def discard(self):
+        self._tmp.close()
+        os.remove(self._tmp.name)
+
+    def finish(self):
+        """Move the file into place and return its /uploads/... URL"""
+        self._tmp.close()
+        name = self._digest.hexdigest()
+        shard = os.path.join(self._folder_path, name[:2])
+        os.makedirs(shard, exist_ok=True)
+        path = os.path.join(shard, f"{name}{self.ext}")
+        if os.path.exists(path):
+            os.remove(self._tmp.name)  # already stored
+            # Restart gc-uploads' grace period: the blob may be an orphan about
+            # to be collected, and the row that now points at it isn't committed yet
+            os.utime(path)
+        else:
+            os.chmod(self._tmp.name, FILE_MODE)
+            os.replace(self._tmp.name, path)
+        return f"/uploads/{self.folder}/{name[:2]}/{name}{self.ext}"
+
+
+def apply_refcount_delta(connection, url, delta):
+    """Atomically add `delta` to the reference count of `url`, creating its row if needed"""
+    if not url or not url.startswith('/uploads/') or not delta:
+        return
+
+    dialect = postgresql if connection.dialect.name == 'postgresql' else sqlite
+    table = StoredFile.__table__
+    stmt = dialect.insert(table).values(url=url, refcount=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.url],
+        set_={'refcount': table.c.refcount + stmt.excluded.refcount}
+    )
+    connection.execute(stmt)
+
+
+def _count_insert(mapper, connection, target):
+    apply_refcount_delta(connection, getattr(target, UPLOAD_FIELDS[type(target)]), 1)
+
+def _count_update(mapper, connection, target):
+    history = getattr(db.inspect(target).attrs, UPLOAD_FIELDS[type(target)]).history
+    if not history.deleted:
+        return
+    apply_refcount_delta(connection, history.deleted[0], -1)
+    apply_refcount_delta(connection, getattr(target, UPLOAD_FIELDS[type(target)]), 1)
+
+def _count_delete(mapper, connection, target):
+    apply_refcount_delta(connection, getattr(target, UPLOAD_FIELDS[type(target)]), -1)
+
+for _model in UPLOAD_FIELDS:
+    db.event.listen(_model, 'after_insert', _count_insert)
+    db.event.listen(_model, 'after_update', _count_update)
+    db.event.listen(_model, 'after_delete', _count_delete)
+
+
+def collect_garbage(grace_seconds, dry_run=False):
+    """
+    Delete files under UPLOAD_ROOT whose stored_files count is zero or that
+    have no row at all (an upload whose row was never committed), with their
+    image variants, then drop the emptied rows. Files younger than
+    `grace_seconds` are kept, since their row may not be committed yet.
+    Returns (files removed, bytes freed).
+    """
+    root = current_app.config['UPLOAD_ROOT']
+    keep = set()
+    for (url,) in db.session.query(StoredFile.url).filter(StoredFile.refcount > 0):
+        path = upload_path(url)
+        keep.add(os.path.normpath(path))
+        keep.update(os.path.normpath(variant) for variant in variant_paths(path))
+
+    cutoff = time.time() - grace_seconds
+    removed = freed = 0
+    removed_urls = []
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.normpath(os.path.join(directory, filename))
+            if path in keep:
+                continue
+            stat = os.stat(path)
+            if stat.st_mtime > cutoff:
+                continue
+            if not dry_run:
+                os.remove(path)
+            removed += 1
+            freed += stat.st_size
+            removed_urls.append('/uploads/' + os.path.relpath(path, root).replace(os.sep, '/'))
+        if not dry_run and directory != root and len(os.path.basename(directory)) == 2 \
+                and not os.listdir(directory):
+            os.rmdir(directory)  # emptied hash shard
+
+    if not dry_run:
+        # A row referenced again since it was read keeps its count, and so survives
+        for start in range(0, len(removed_urls), 500):
+            StoredFile.query.filter(StoredFile.url.in_(removed_urls[start:start + 500]),
+                                    StoredFile.refcount <= 0).delete(synchronize_session=False)
+        db.session.commit()
+    return removed, freed
@@ -0,0 +1,130 @@
+"""
+Streaming multipart uploads.
+
+receive_upload() parses the request body itself instead of letting Werkzeug
+spool every file part first. The one file field it cares about is checked
+on arrival: magic bytes from the first chunk decide the type (and the
+stored extension, whatever the client named it), and size is checked as
+it grows. Accepted bytes go straight into an
+UploadWriter, so a rejected upload costs at most one chunk.
+"""
+from collections import namedtuple
+
+from flask import current_app, request
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+from .storage import UploadWriter
+from .utils import ALLOWED_EXTENSIONS
+
+CHUNK_SIZE = 64 * 1024
+MAGIC_BYTES_NEEDED = 12
+
+Upload = namedtuple('Upload', ['form', 'url'])
+
+
+class UploadRejected(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def sniff_image_type(head):
+    """Image type from the leading bytes of a file, or None"""
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+def _allowed_extension(image_type):
+    """Stored extension for a sniffed image type, or None if it isn't allowed"""
+    ext = 'jpg' if image_type == 'jpeg' else image_type
+    return ext if ext in ALLOWED_EXTENSIONS else None
+
+
+def receive_upload(file_field, folder):
+    """
+    Read the form fields of the current request and store the file in
+    `file_field` under uploads/<folder>/. Returns Upload(form, url), where url
+    is None when no file was sent. Raises UploadRejected for a disallowed
+    file, and with status 413 for anything over a size limit (file, form
+    field or MAX_CONTENT_LENGTH); nothing is left on disk in that case.
+    """
+    if request.mimetype != 'multipart/form-data':
+        return Upload(request.form, None)
+    boundary = request.mimetype_params.get('boundary', '').encode()
+    if not boundary:
+        raise UploadRejected('Malformed multipart body')
+
+    max_file_size = current_app.config['UPLOAD_MAX_FILE_SIZE']
+    max_field_size = current_app.config['MAX_FORM_MEMORY_SIZE']
+    decoder = MultipartDecoder(boundary, max_form_memory_size=max_field_size,
+                               max_parts=current_app.config['MAX_FORM_PARTS'])
+    fields = []
+    url = None
+    part = None       # the Field/File event currently receiving data
+    field_data = []   # Field: collected value
+    writer = None     # File: our upload, once its type is confirmed
+    head = b''        # File: leading bytes awaiting the magic check
+    receiving = False  # File: True while the part is the upload we store
+
+    try:
+        while True:
+            chunk = request.stream.read(CHUNK_SIZE)
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, (Epilogue, NeedData)):
+                if isinstance(event, Field):
+                    part, field_data = event, []
+                elif isinstance(event, File):
+                    part = event
+                    receiving = event.name == file_field and bool(event.filename) and url is None
+                    head = b''
+                elif isinstance(event, Data):
+                    if isinstance(part, Field):
+                        field_data.append(event.data)
+                        if sum(map(len, field_data)) > max_field_size:
+                            raise UploadRejected('Form field is too large', 413)
+                        if not event.more_data:
+                            fields.append((part.name, b''.join(field_data).decode('utf-8', 'replace')))
+                    elif receiving:
+                        if writer is None:
+                            head += event.data
+                            if len(head) < MAGIC_BYTES_NEEDED and event.more_data:
+                                event = decoder.next_event()
+                                continue
+                            ext = _allowed_extension(sniff_image_type(head))
+                            if ext is None:
+                                raise UploadRejected('File type not allowed')
+                            writer = UploadWriter(folder, f'upload.{ext}')
+                            writer.write(head)
+                        else:
+                            writer.write(event.data)
+                        if writer.size > max_file_size:
+                            raise UploadRejected('File is too large', 413)
+                        if not event.more_data:
+                            url = writer.finish()
+                            writer, receiving = None, False
+                event = decoder.next_event()
+            if isinstance(event, Epilogue) or not chunk:
+                break
+    except RequestEntityTooLarge:
+        # Body over MAX_CONTENT_LENGTH (LimitedStream) or a part over the decoder's limits
+        if writer is not None:
+            writer.discard()
+        raise UploadRejected('Request is too large', 413)
+    except BaseException:
+        if writer is not None:
+            writer.discard()
+        raise
+
+    if writer is not None:
+        writer.discard()
+        raise UploadRejected('Upload was interrupted')
+    return Upload(MultiDict(fields), url)
@@ -0,0 +1,27 @@
+import json
+import os
+
+from flask import current_app
+
+ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+
+def upload_path(url):
+    """Filesystem path of an /uploads/... URL"""
+    return os.path.join(current_app.config['UPLOAD_ROOT'], url[len('/uploads/'):])
+
+def parse_json_field(raw, expected_type, field):
+    """
+    Validate a JSON-encoded form field once at write time.
+    Blank input maps to None; anything else must decode to `expected_type`.
+    """
+    raw = (raw or '').strip()
+    if not raw:
+        return None
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        raise ValueError(f'{field} must be valid JSON')
+    if not isinstance(value, expected_type):
+        kind = 'an array' if expected_type is list else 'an object'
+        raise ValueError(f'{field} must be {kind}')
+    return value
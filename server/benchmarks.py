@@ -0,0 +1,234 @@
+"""
+Benchmarks, kept out of the app's import path.
+
+    flask --app benchmarks benchmark-charts
+
+Each command runs against the database DATABASE_URL points at; those that
+time endpoints expect one filled by `flask seed-data`. Regression checks
+with fixed expectations live in tests/ instead.
+"""
+import http.client
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from urllib.parse import urlsplit
+
+import click
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import func
+
+from api import create_app
+from api.audit import admin_token, profile_requests
+from api.extensions import db
+from api.json_provider import orjson
+from api.models import Booking, User
+from api.passwords import get_password_hasher
+from api.ratelimit import MemoryRateLimitStore, RateLimiter
+from api.search import search_bookings, search_terms
+
+app = create_app()
+
+
+@app.cli.command('benchmark-charts')
+@click.option('--repeat', default=20, help='Requests to time per range')
+def benchmark_charts_command(repeat):
+    """Report the queries and latency of /api/dashboard/charts per range (run after seed-data)"""
+    try:
+        token = admin_token()
+    except RuntimeError as e:
+        print(f"❌ {str(e)}")
+        raise SystemExit(1)
+    paths = [f'/api/dashboard/charts?range={days}' for days in ('7d', '30d', '90d')]
+    results = profile_requests(app, paths, token, repeat)
+    print(f"📊 {db.engine.dialect.name}, {Booking.query.count():,} bookings, {User.query.count():,} users")
+    for path, result in results.items():
+        print(f"   {path.rsplit('=', 1)[1]:>3}: {result['statements']} queries, "
+              f"p50 {result['ms']:.1f} ms (HTTP {result['status']})")
+    # The query count must not grow with the number of days charted
+    if len({result['statements'] for result in results.values()}) > 1:
+        print("❌ Query count depends on the range")
+        raise SystemExit(1)
+
+
+@app.cli.command('benchmark-json')
+@click.option('--rows', default=10000, help='Bookings to serialize')
+@click.option('--repeat', default=5, help='Runs to time (the best is reported)')
+def benchmark_json_command(rows, repeat):
+    """Compare the app's JSON provider with Flask's stdlib one on a bookings list response"""
+    now = datetime.utcnow()
+    users = [User(id=n, name=f'User {n}', email=f'user{n}@example.com') for n in range(100)]
+    bookings = [
+        Booking(id=n, user_id=n % 100, user=users[n % 100], pickup_location='Airport, Lahore',
+                dropoff_location='Mall, Karachi', car_type='sedan', status='completed', ride_date=now,
+                price=Decimal('2500.00'), created_at=now, updated_at=now)
+        for n in range(rows)
+    ]
+
+    def best(fn):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
+
+    payload = {'success': True, 'bookings': [booking.to_dict() for booking in bookings]}
+    print(f"🧾 {rows:,} bookings")
+    for label, fn in [
+        ('to_dict', lambda: [booking.to_dict() for booking in bookings]),
+        ('stdlib json', lambda: DefaultJSONProvider(app).dumps(payload)),
+        (f"app.json ({'orjson' if orjson else 'stdlib fallback'})", lambda: app.json.dumps(payload)),
+    ]:
+        print(f"   {label + ':':<26} {best(fn):.1f} ms")
+
+
+@app.cli.command('benchmark-http')
+@click.option('--url', default='http://127.0.0.1:4000/api/health', help='URL to load')
+@click.option('--concurrency', default=32, help='Concurrent keep-alive connections')
+@click.option('--seconds', default=10.0, help='How long to run')
+def benchmark_http_command(url, concurrency, seconds):
+    """
+    Load a running server with concurrent GETs and report req/s and latency,
+    e.g. `python app.py` against `gunicorn -c gunicorn.conf.py wsgi:app`
+    """
+    parts = urlsplit(url)
+    target = parts.path + (f'?{parts.query}' if parts.query else '')
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    deadline = time.perf_counter() + seconds
+
+    def worker():
+        timings, errors = [], 0
+        connection = connection_class(parts.netloc, timeout=30)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                connection.request('GET', target)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    errors += 1
+                else:
+                    timings.append((time.perf_counter() - started) * 1000)
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                connection.close()  # reconnects on the next request
+        connection.close()
+        return timings, errors
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(lambda _: worker(), range(concurrency)))
+    timings = sorted(timing for worker_timings, _ in results for timing in worker_timings)
+    errors = sum(worker_errors for _, worker_errors in results)
+    print(f"🌐 {url}, {concurrency} connections for {seconds:.0f}s")
+    if not timings:
+        print(f"❌ No successful requests ({errors} errors)")
+        raise SystemExit(1)
+    print(f"   {len(timings) / seconds:,.0f} req/s, p50 {timings[len(timings) // 2]:.1f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)]:.1f} ms, p99 {timings[int(len(timings) * 0.99)]:.1f} ms, "
+          f"{errors} errors")
+
+
+@app.cli.command('benchmark-startup')
+@click.option('--runs', default=5, help='Fresh interpreters to time')
+def benchmark_startup_command(runs):
+    """Report cold import and create_app() times, and check that neither touches the database"""
+    script = (
+        "import time; started = time.perf_counter()\n"
+        "import sqlalchemy as sa\n"
+        "connections = []\n"
+        "sa.event.listen(sa.pool.Pool, 'connect', lambda *args: connections.append(1))\n"
+        "import api; imported = time.perf_counter()\n"
+        "api.create_app(); created = time.perf_counter()\n"
+        "print(imported - started, created - imported, len(connections))\n"
+    )
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(app.root_path),
+                                capture_output=True, text=True, check=True).stdout
+        total = time.perf_counter() - started
+        imported, created, connections = output.split()
+        timings.append((float(imported) * 1000, float(created) * 1000, total * 1000, int(connections)))
+
+    imports, creates, totals, connections = zip(*timings)
+    print(f"🚀 {runs} cold starts (median)")
+    print(f"   import api:   {sorted(imports)[runs // 2]:.0f} ms")
+    print(f"   create_app(): {sorted(creates)[runs // 2]:.0f} ms")
+    print(f"   process:      {sorted(totals)[runs // 2]:.0f} ms (interpreter start included)")
+    if any(connections):
+        print(f"❌ Import or create_app() opened {max(connections)} database connections")
+        raise SystemExit(1)
+    print("✅ No database connections at startup")
+
+
+@app.cli.command('benchmark-password-hash')
+@click.option('--seconds', default=5.0, help='How long to run each measurement')
+def benchmark_password_hash_command(seconds):
+    """Report password verifications (logins) per second for PASSWORD_HASH_METHOD"""
+    password_hasher = get_password_hasher()
+    stored = password_hasher.hash('benchmark-password')
+
+    def run(threads):
+        deadline = time.perf_counter() + seconds
+        def worker():
+            count = 0
+            while time.perf_counter() < deadline:
+                password_hasher.verify(stored, 'benchmark-password')
+                count += 1
+            return count
+        with ThreadPoolExecutor(threads) as executor:
+            return sum(executor.map(lambda _: worker(), range(threads))) / seconds
+
+    print(f"🔐 {password_hasher.method}")
+    print(f"   1 core: {run(1):.1f} logins/s")
+    workers = password_hasher.workers
+    total = run(workers * 2)
+    print(f"   {workers} hashing threads: {total:.1f} logins/s ({total / workers:.1f} per core)")
+
+
+@app.cli.command('benchmark-rate-limit')
+@click.option('--hits', default=200000, help='Number of checks to time')
+@click.option('--keys', default=10000, help='Number of distinct keys to spread them over')
+def benchmark_rate_limit_command(hits, keys):
+    """Report the in-memory rate limiter's overhead per request"""
+    limiter = RateLimiter(MemoryRateLimitStore(app.config['RATE_LIMIT_MAX_KEYS']))
+    names = [f'login:ip:10.0.{i // 256}.{i % 256}' for i in range(keys)]
+    started = time.perf_counter()
+    for i in range(hits):
+        limiter.check(names[i % keys], '30/60')
+    elapsed = time.perf_counter() - started
+    print(f"⏱️  {elapsed / hits * 1e6:.2f} µs per check ({hits / elapsed:,.0f} checks/s, {keys} keys)")
+
+
+@app.cli.command('benchmark-search')
+@click.option('--queries', default=200, help='Number of searches to time')
+@click.option('--limit', default=50, help='Page size')
+def benchmark_search_command(queries, limit):
+    """Time /api/bookings/search queries against the bookings already in the database"""
+    samples = db.session.query(Booking.pickup_location, Booking.dropoff_location, User.email) \
+        .join(User, Booking.user_id == User.id).order_by(func.random()).limit(queries).all()
+    if not samples:
+        print("⚠️ No bookings to search")
+        return
+    words = []
+    for i, sample in enumerate(samples):
+        text = (sample.pickup_location, sample.dropoff_location, sample.email.split('@')[0])[i % 3]
+        terms = search_terms(text)
+        words.append(terms[:1] if i % 2 else [term[:4] for term in terms[:2]])
+
+    started = time.perf_counter()
+    search_bookings(words[0], 0, limit)  # loads the in-memory index when not on Postgres
+    print(f"🔎 {db.engine.dialect.name}, {Booking.query.count():,} bookings "
+          f"(first query {(time.perf_counter() - started) * 1000:.1f} ms)")
+    timings = []
+    for terms in words:
+        started = time.perf_counter()
+        search_bookings(terms, 0, limit)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    print(f"   p50 {timings[len(timings) // 2]:.2f} ms, p95 {timings[int(len(timings) * 0.95)]:.2f} ms, "
+          f"max {timings[-1]:.2f} ms over {len(timings)} queries")
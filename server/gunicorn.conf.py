@@ -0,0 +1,48 @@
+"""
+Gunicorn configuration. Every setting can be overridden from the environment.
+
+Defaults: (2 x CPU + 1) worker processes with a few threads each, the app
+preloaded once in the master and shared copy-on-write, and workers
+recycled after a jittered number of requests.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:4000')
+
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Import the app once in the master; workers fork from it
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# Recycle workers gradually to bound memory growth
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+
+
+def on_starting(server):
+    # Refuse to boot while migrations are pending. This is one version query,
+    # not a reflection of every table.
+    from api.migrations import check_schema_version
+    from wsgi import app
+    if app.config['SCHEMA_VERSION_CHECK']:
+        with app.app_context():
+            check_schema_version()
+
+
+def post_fork(server, worker):
+    # Connections opened by the master during preload must not be shared
+    # between processes; each worker opens its own pool.
+    from api.extensions import db
+    from wsgi import app
+    with app.app_context():
+        db.engine.dispose(close=False)
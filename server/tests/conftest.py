@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+
+import pytest
+import sqlalchemy as sa
+
+from api import create_app, init_db
+from api.extensions import db
+from api.models import User
+from api.security import generate_token
+
+
+def make_app(tmp_path, name='test', **config):
+    """An app on its own SQLite file under `tmp_path`, migrated to the newest revision"""
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / f'{name}.db'}",
+        'UPLOAD_ROOT': str(tmp_path / 'uploads'),
+        'RATE_LIMIT_ENABLED': False,
+        **config,
+    })
+    with app.app_context():
+        init_db()
+    return app
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path)
+    yield app
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(app):
+    """auth_headers(user_id) -> an Authorization header for that user"""
+    def headers(user_id):
+        with app.app_context():
+            return {'Authorization': f'Bearer {generate_token(db.session.get(User, user_id))}'}
+    return headers
+
+@pytest.fixture
+def count_queries():
+    """`with count_queries() as statements:` records every SQL statement run inside the block"""
+    @contextmanager
+    def count():
+        statements = []
+
+        def record(connection, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sa.event.listen(sa.engine.Engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            sa.event.remove(sa.engine.Engine, 'before_cursor_execute', record)
+    return count
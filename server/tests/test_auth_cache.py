@@ -0,0 +1,30 @@
+"""Cached auth state: a role change is seen at once by its own worker and within AUTH_CACHE_TTL by the others"""
+import time
+
+from api.extensions import db
+from api.models import User
+from api.security import generate_token
+
+from conftest import make_app
+
+
+def test_demotion_reaches_other_workers_within_the_ttl(tmp_path):
+    # Two apps on one database are two gunicorn workers with their own auth caches
+    worker, other = (make_app(tmp_path, AUTH_CACHE_TTL=1) for _ in range(2))
+    with worker.app_context():
+        admins = [User(name=f'Admin {n}', email=f'admin{n}@example.com', password='-', status='admin',
+                       is_verified=True) for n in range(2)]
+        db.session.add_all(admins)
+        db.session.commit()
+        demoter, demoted = ({'Authorization': f'Bearer {generate_token(admin)}'} for admin in admins)
+        demoted_id = admins[1].id
+
+    for app in (worker, other):
+        assert app.test_client().get('/api/users', headers=demoted).status_code == 200
+    response = worker.test_client().patch(f'/api/users/{demoted_id}/role', headers=demoter, json={'role': 'user'})
+    assert response.status_code == 200
+
+    assert worker.test_client().get('/api/users', headers=demoted).status_code == 403
+    assert other.test_client().get('/api/users', headers=demoted).status_code == 200  # still cached
+    time.sleep(1.1)
+    assert other.test_client().get('/api/users', headers=demoted).status_code == 403
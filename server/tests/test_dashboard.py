@@ -0,0 +1,30 @@
+"""Dashboard user counters come from the daily_stats rollup and a partial index, not a users scan"""
+import sqlalchemy as sa
+
+from api.extensions import db
+from api.models import STAFF_ROLES, User
+
+
+def test_summary_user_counters(app, client, auth_headers):
+    with app.app_context():
+        users = [User(name=f'User {n}', email=f'user{n}@example.com', password='-', status=status,
+                      is_verified=verified)
+                 for n, (status, verified) in enumerate([('admin', True), ('moderator', True), ('user', True),
+                                                         ('user', False), ('user', False)])]
+        db.session.add_all(users)
+        db.session.commit()
+        # As the endpoints do: load the row, then change it
+        User.query.filter_by(email='user3@example.com').one().is_verified = True
+        User.query.filter_by(email='user2@example.com').one().status = 'moderator'
+        db.session.delete(User.query.filter_by(email='user4@example.com').one())
+        db.session.commit()
+        admin_id = users[0].id
+
+    summary = client.get('/api/dashboard/summary', headers=auth_headers(admin_id)).get_json()['summary']
+    assert summary['users'] == {'total': 4, 'verified': 4, 'admins': 1, 'moderators': 2}
+
+def test_staff_counts_read_the_partial_index(app):
+    with app.app_context():
+        plan = db.session.execute(sa.text(
+            f"EXPLAIN QUERY PLAN SELECT status, count(*) FROM users WHERE {STAFF_ROLES} GROUP BY status")).all()
+    assert 'ix_users_staff_status' in plan[-1][-1]
@@ -0,0 +1,53 @@
+"""Revisions are frozen: they must reproduce the models' schema and the mapper-maintained rollups"""
+import importlib
+from datetime import datetime
+from decimal import Decimal
+
+import sqlalchemy as sa
+
+from api.extensions import db
+from api.migrations import Operations
+from api.models import Booking, Car, ContentBlock, StoredFile, User
+from api.rollup import check_daily_stats
+
+
+def schema(engine):
+    """Columns and indexes per table, as the inspector reports them"""
+    inspector = sa.inspect(engine)
+    return {
+        table: (
+            {(column['name'], str(column['type']), column['nullable'], (column['default'] or '').strip("'"))
+             for column in inspector.get_columns(table)},
+            {(index['name'], tuple(index['column_names']), index['unique'])
+             for index in inspector.get_indexes(table)},
+        )
+        for table in inspector.get_table_names() if table != 'schema_migrations'
+    }
+
+def test_migrated_schema_matches_the_models(app, tmp_path):
+    reference = sa.create_engine(f"sqlite:///{tmp_path / 'models.db'}")
+    db.metadata.create_all(reference)
+    with app.app_context():
+        assert schema(db.engine) == schema(reference)
+
+def test_backfill_matches_the_mapper_maintained_tables(app):
+    with app.app_context():
+        rider = User(name='Rider', email='rider@example.com', password='-', is_verified=True,
+                     created_at=datetime(2024, 1, 1))
+        db.session.add_all([rider, User(name='New', email='new@example.com', password='-',
+                                        created_at=datetime(2024, 1, 1))])
+        db.session.add_all(Booking(user=rider, pickup_location='A', dropoff_location='B', car_type='sedan',
+                                   status=status, price=Decimal('12.50'), created_at=datetime(2024, 1, day))
+                           for day, status in ((1, 'completed'), (1, 'pending'), (2, 'completed')))
+        db.session.add_all([Car(name='Shared', image_url='/uploads/cars/ab/ab.png'),
+                            Car(name='Also shared', image_url='/uploads/cars/ab/ab.png'),
+                            ContentBlock(key='hero', media_url='/uploads/content/cd/cd.png')])
+        db.session.commit()
+        stored = {row.url: row.refcount for row in StoredFile.query}
+
+        for revision in ('0005_backfill_rollups', '0006_user_counters'):
+            importlib.import_module(f'api.migrations.{revision}').upgrade(Operations(db.engine))
+        db.session.expire_all()
+        assert check_daily_stats() == []
+        assert {row.url: row.refcount for row in StoredFile.query} == stored == {
+            '/uploads/cars/ab/ab.png': 2, '/uploads/content/cd/cd.png': 1}
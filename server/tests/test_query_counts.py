@@ -0,0 +1,56 @@
+"""List endpoints run a fixed number of statements however many rows they return (no N+1 lazy loads)"""
+import pytest
+
+from api.extensions import db
+from api.models import Booking, Car, ContentBlock, User
+
+
+@pytest.fixture
+def users(app):
+    """(admin id, id of a user with 3 bookings); 21 users, 60 bookings, 30 cars, 10 content blocks"""
+    with app.app_context():
+        admin = User(name='Admin', email='admin@example.com', password='-', status='admin', is_verified=True)
+        riders = [User(name=f'Rider {n}', email=f'rider{n}@example.com', password='-', is_verified=True)
+                  for n in range(20)]
+        db.session.add_all([admin, *riders])
+        db.session.add_all(Booking(user=riders[n % 20], pickup_location=f'Pickup {n}', dropoff_location='Dropoff',
+                                   car_type='sedan') for n in range(60))
+        db.session.add_all(Car(name=f'Car {n}', is_active=True) for n in range(30))
+        db.session.add_all(ContentBlock(key=f'block_{n}', title=f'Block {n}', updater=riders[n])
+                           for n in range(10))
+        db.session.commit()
+        return admin.id, riders[0].id
+
+
+@pytest.mark.parametrize('path, rows', [
+    ('/api/bookings?limit=1', 1),
+    ('/api/bookings?limit=50', 50),
+    ('/api/users?limit=1', 1),
+    ('/api/users?limit=50', 21),
+    ('/api/cars?limit=1', 1),
+    ('/api/cars?limit=50', 30),
+    ('/api/content?key=block_0', 1),
+    ('/api/content', 10),
+])
+def test_admin_list_statements(client, users, auth_headers, count_queries, path, rows):
+    admin_id, _ = users
+    headers = auth_headers(admin_id)
+    client.get(path, headers=headers)  # fills the auth cache, so only the list query is counted
+
+    with count_queries() as statements:
+        response = client.get(f"{path}{'&' if '?' in path else '?'}nocache=1", headers=headers)
+    body = response.get_json()
+    listed = next(value for value in body.values() if isinstance(value, list))
+    assert response.status_code == 200
+    assert len(listed) == rows
+    assert len(statements) == 1, statements
+
+def test_my_bookings_statements(client, users, auth_headers, count_queries):
+    _, rider_id = users
+    headers = auth_headers(rider_id)
+    client.get('/api/bookings/my-bookings', headers=headers)  # fills the auth cache
+
+    with count_queries() as statements:
+        response = client.get('/api/bookings/my-bookings', headers=headers)
+    assert len(response.get_json()['bookings']) == 3
+    assert len(statements) == 1, statements
@@ -0,0 +1,98 @@
+"""@read_replica routing, with two SQLite files standing in for the primary and a replica"""
+import time
+
+import pytest
+import sqlalchemy as sa
+
+from api.extensions import db
+from api.models import Booking, Car, User
+from api.routing import MemoryStickyStore
+
+from conftest import make_app
+
+USERS = [{'id': n, 'name': f'User {n}', 'email': f'user{n}@example.com', 'password': '-',
+          'status': 'user', 'is_verified': True, 'token_version': 0} for n in (1, 2)]
+
+
+def make_worker(tmp_path, **config):
+    """An app reading from replica.db; every call shares the same primary and replica files"""
+    config = {'DB_REPLICA_URLS': [f"sqlite:///{tmp_path / 'replica.db'}"], 'DB_REPLICA_STICKY_SECONDS': 1,
+              'WEB_CONCURRENCY': 1, **config}
+    return make_app(tmp_path, 'primary', **config)
+
+@pytest.fixture
+def worker(tmp_path):
+    """
+    An app whose primary and replica hold different rows, so each response
+    shows which database served it: only the replica has user 2's booking.
+    """
+    app = make_worker(tmp_path)
+    with app.app_context():
+        primary, replica = db.engine, db.engines['replica_0']
+        db.metadata.create_all(replica)
+        for engine, car in ((primary, 'Primary car'), (replica, 'Replica car')):
+            with engine.begin() as connection:
+                connection.execute(sa.insert(User), USERS)
+                connection.execute(sa.insert(Car), {'name': car, 'is_active': True})
+        with replica.begin() as connection:
+            connection.execute(sa.insert(Booking), {'user_id': 2, 'pickup_location': 'Replica',
+                                                    'dropoff_location': 'Replica', 'car_type': 'sedan'})
+    return app
+
+
+def count_bookings(engine):
+    with engine.connect() as connection:
+        return connection.execute(sa.select(sa.func.count()).select_from(Booking)).scalar()
+
+def book(client, headers):
+    return client.post('/api/bookings', headers=headers,
+                       json={'pickup_location': 'Primary', 'dropoff_location': 'Primary', 'car_type': 'sedan'})
+
+def my_bookings(client, headers):
+    return client.get('/api/bookings/my-bookings', headers=headers).get_json()['bookings']
+
+def car_names(client, query):
+    # A fresh query string skips the response cache
+    return [car['name'] for car in client.get(f'/api/cars?{query}').get_json()['cars']]
+
+def headers_for(app, user_id):
+    from api.security import generate_token
+    with app.app_context():
+        return {'Authorization': f'Bearer {generate_token(db.session.get(User, user_id))}'}
+
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary(worker):
+    client = worker.test_client()
+    assert car_names(client, 'a=1') == ['Replica car']
+    assert book(client, headers_for(worker, 1)).status_code == 201
+    with worker.app_context():
+        assert count_bookings(db.engine) == 1
+        assert count_bookings(db.engines['replica_0']) == 1  # only the replica's own booking
+
+def test_user_reads_stick_to_the_primary_after_their_write(worker):
+    client = worker.test_client()
+    writer, reader = headers_for(worker, 1), headers_for(worker, 2)
+    book(client, writer)
+    assert len(my_bookings(client, writer)) == 1  # primary
+    assert len(my_bookings(client, reader)) == 1  # other users still read the replica
+    time.sleep(1.1)
+    assert my_bookings(client, writer) == []  # back on the replica after DB_REPLICA_STICKY_SECONDS
+
+def test_table_reads_stick_to_the_primary_after_a_write(worker):
+    with worker.app_context():
+        db.session.add(Car(name='New car', is_active=True))
+        db.session.commit()
+    assert 'Primary car' in car_names(worker.test_client(), 'b=1')
+
+def test_write_on_one_worker_keeps_other_workers_on_the_primary(tmp_path, worker):
+    # Two apps are two gunicorn workers; a shared store (Redis in production) links them
+    other = make_worker(tmp_path)
+    other.extensions['replica_sticky'] = worker.extensions['replica_sticky']
+    headers = headers_for(worker, 1)
+    assert book(worker.test_client(), headers).status_code == 201
+    assert len(my_bookings(other.test_client(), headers)) == 1
+
+def test_in_memory_sticky_store_needs_a_single_worker(tmp_path):
+    assert isinstance(make_worker(tmp_path).extensions['replica_sticky'], MemoryStickyStore)
+    with pytest.raises(RuntimeError, match='DB_REPLICA_STICKY_URL'):
+        make_worker(tmp_path, WEB_CONCURRENCY=2)
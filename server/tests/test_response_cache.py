@@ -0,0 +1,49 @@
+"""@cached_response entries are retired by writes, and expire quickly where other workers' writes can't reach them"""
+import time
+
+import pytest
+
+from api.extensions import db
+from api.models import Car, User
+from api.security import generate_token
+
+from conftest import make_app
+
+
+def car_names(client):
+    return [car['name'] for car in client.get('/api/cars').get_json()['cars']]
+
+def delete_car(app, car_id):
+    with app.app_context():
+        admin = User(name='Admin', email=f'admin{car_id}@example.com', password='-', status='admin', is_verified=True)
+        db.session.add(admin)
+        db.session.commit()
+        headers = {'Authorization': f'Bearer {generate_token(admin)}'}
+    assert app.test_client().delete(f'/api/cars/{car_id}', headers=headers).status_code == 200
+
+@pytest.fixture
+def car_id(app):
+    with app.app_context():
+        car = Car(name='Old car', is_active=True)
+        db.session.add(car)
+        db.session.commit()
+        return car.id
+
+
+def test_write_retires_the_workers_own_entries(app, client, car_id):
+    assert car_names(client) == ['Old car']
+    delete_car(app, car_id)
+    assert car_names(client) == []
+
+def test_other_workers_entries_expire_after_the_local_ttl(tmp_path, car_id):
+    # Two apps on one database are two gunicorn workers with in-memory caches
+    worker, other = (make_app(tmp_path, WEB_CONCURRENCY=2, RESPONSE_CACHE_LOCAL_TTL=1) for _ in range(2))
+    assert car_names(worker.test_client()) == ['Old car']
+    delete_car(other, car_id)
+    assert car_names(worker.test_client()) == ['Old car']
+    time.sleep(1.1)
+    assert car_names(worker.test_client()) == []
+
+def test_single_worker_keeps_the_full_ttl(tmp_path):
+    app = make_app(tmp_path, WEB_CONCURRENCY=1)
+    assert app.extensions['response_cache']._entries.ttl == app.config['RESPONSE_CACHE_TTL']
@@ -0,0 +1,34 @@
+"""Booking search ranks only the newest SEARCH_MAX_CANDIDATES matches, and says so"""
+import pytest
+
+from api.extensions import db
+from api.models import Booking, User
+
+from conftest import make_app
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = make_app(tmp_path, SEARCH_MAX_CANDIDATES=3)
+    with app.app_context():
+        admin = User(name='Admin', email='admin@example.com', password='-', status='admin', is_verified=True)
+        db.session.add(admin)
+        db.session.add_all(Booking(user=admin, pickup_location=f'Paris {n}', dropoff_location='Lyon',
+                                   car_type='sedan') for n in range(5))
+        db.session.add(Booking(user=admin, pickup_location='Nice', dropoff_location='Lyon', car_type='sedan'))
+        db.session.commit()
+    return app
+
+
+def search(client, auth_headers, q):
+    return client.get(f'/api/bookings/search?q={q}', headers=auth_headers(1)).get_json()
+
+def test_capped_search_keeps_the_newest_matches_and_flags_truncation(client, auth_headers):
+    body = search(client, auth_headers, 'paris')
+    assert sorted(booking['pickup_location'] for booking in body['bookings']) == ['Paris 2', 'Paris 3', 'Paris 4']
+    assert body['truncated'] is True
+
+def test_search_under_the_cap_is_not_truncated(client, auth_headers):
+    body = search(client, auth_headers, 'nice')
+    assert [booking['pickup_location'] for booking in body['bookings']] == ['Nice']
+    assert body['truncated'] is False
@@ -0,0 +1,40 @@
+"""Content-addressed uploads and gc-uploads, which works from the stored_files reference counts"""
+import os
+import stat
+
+from api.extensions import db
+from api.models import Car, StoredFile
+from api.storage import FILE_MODE, UploadWriter, collect_garbage
+from api.utils import upload_path
+
+
+def store(content):
+    writer = UploadWriter('cars', 'photo.png')
+    writer.write(content)
+    path = upload_path(writer.finish())
+    os.utime(path, (0, 0))  # older than any grace period
+    return path
+
+
+def test_upload_lands_under_upload_root_readable_by_the_front_server(app):
+    with app.app_context():
+        path = store(b'image')
+    assert path.startswith(app.config['UPLOAD_ROOT'])
+    assert stat.S_IMODE(os.stat(path).st_mode) == FILE_MODE
+
+def test_gc_removes_unreferenced_files_and_their_rows(app):
+    with app.app_context():
+        kept, dropped, orphan = store(b'kept'), store(b'dropped'), store(b'orphan')
+        url = lambda path: '/uploads/' + os.path.relpath(path, app.config['UPLOAD_ROOT'])
+        db.session.add_all([Car(name='Kept', image_url=url(kept)), Car(name='Dropped', image_url=url(dropped))])
+        db.session.commit()
+        db.session.delete(Car.query.filter_by(name='Dropped').one())
+        db.session.commit()
+        assert db.session.get(StoredFile, url(dropped)).refcount == 0
+
+        assert collect_garbage(60, dry_run=True) == (2, len(b'dropped') + len(b'orphan'))
+        assert os.path.exists(dropped)
+        assert collect_garbage(60)[0] == 2
+
+        assert os.path.exists(kept) and not os.path.exists(dropped) and not os.path.exists(orphan)
+        assert {row.url: row.refcount for row in StoredFile.query} == {url(kept): 1}
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+    flask --app wsgi db-upgrade
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from api import create_app
+
+app = create_app()
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=4000)